@@ -10,10 +10,20 @@ import platform
 import subprocess
 import psutil
 import time
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from .profile_manager import ProfileInfo
 
+def _find_arg_value(cmdline: List[str], prefix: str) -> Optional[str]:
+    """在命令行参数列表中查找指定前缀的参数值（保留路径中的空格）"""
+    for arg in cmdline:
+        if arg.startswith(prefix):
+            return arg[len(prefix):]
+    return None
+
 @dataclass
 class BrowserInstance:
     """浏览器实例信息"""
@@ -30,6 +40,45 @@ class BrowserManager:
     def __init__(self):
         self.running_instances: Dict[str, BrowserInstance] = {}
         self.chrome_executable = self._find_chrome_executable()
+        # 每个线程独立的进程快照，由process_snapshot()设置
+        self._snapshot_local = threading.local()
+    
+    @contextmanager
+    def process_snapshot(self):
+        """在with块内共用一次Chrome进程遍历结果（按线程隔离，可嵌套）"""
+        if getattr(self._snapshot_local, 'chrome_processes', None) is not None:
+            # 外层已有快照，直接复用
+            yield
+            return
+        
+        self._snapshot_local.chrome_processes = self._scan_chrome_processes()
+        try:
+            yield
+        finally:
+            self._snapshot_local.chrome_processes = None
+    
+    def _scan_chrome_processes(self) -> List[Dict]:
+        """遍历一次系统进程，收集名称包含chrome的进程"""
+        chrome_processes = []
+        for proc in psutil.process_iter(['pid', 'name']):
+            name = proc.info['name']
+            if name and 'chrome' in name.lower():
+                chrome_processes.append({'process': proc, 'pid': proc.info['pid'], 'name': name})
+        return chrome_processes
+    
+    def _chrome_processes(self) -> List[Dict]:
+        """获取Chrome进程列表：有快照时使用快照，否则重新遍历"""
+        chrome_processes = getattr(self._snapshot_local, 'chrome_processes', None)
+        if chrome_processes is not None:
+            return chrome_processes
+        return self._scan_chrome_processes()
+    
+    @staticmethod
+    def _process_cmdline(entry: Dict) -> List[str]:
+        """读取进程命令行，结果缓存在快照条目中"""
+        if 'cmdline' not in entry:
+            entry['cmdline'] = entry['process'].cmdline()
+        return entry['cmdline']
     
     def _find_chrome_executable(self) -> Optional[str]:
         """查找Chrome可执行文件路径"""
@@ -230,10 +279,9 @@ class BrowserManager:
                         if proc.info['name'] and ('chrome' in proc.info['name'].lower() or 'google chrome' in proc.info['name'].lower()):
                             cmdline = proc.info['cmdline']
                             if cmdline:
-                                cmdline_str = ' '.join(cmdline)
                                 chrome_processes.append({
                                     'pid': proc.info['pid'],
-                                    'cmdline': cmdline_str
+                                    'cmdline': cmdline
                                 })
                     except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                         continue
@@ -244,10 +292,10 @@ class BrowserManager:
                 for proc_info in chrome_processes:
                     cmdline = proc_info['cmdline']
                     
-                    # 检查独立用户数据目录
-                    if independent_user_data_dir.replace(' ', '\\ ') in cmdline or independent_user_data_dir in cmdline:
+                    # 检查独立用户数据目录（直接比较参数值，不再拼接命令行做子串匹配）
+                    if _find_arg_value(cmdline, '--user-data-dir=') == independent_user_data_dir:
                         # 确保这是主进程（不是Helper进程）
-                        if '--type=' not in cmdline:
+                        if _find_arg_value(cmdline, '--type=') is None:
                             print(f"找到使用独立目录的Chrome进程: PID={proc_info['pid']}")
                             return True
                 
@@ -272,12 +320,10 @@ class BrowserManager:
                     if proc.info['name'] == 'Google Chrome':
                         cmdline = proc.info['cmdline']
                         if cmdline:
-                            cmdline_str = ' '.join(cmdline)
-                            
                             # 检查独立用户数据目录
-                            if independent_user_data_dir.replace(' ', '\\ ') in cmdline_str or independent_user_data_dir in cmdline_str:
+                            if _find_arg_value(cmdline, '--user-data-dir=') == independent_user_data_dir:
                                 # 确保这是主进程
-                                if '--type=' not in cmdline_str:
+                                if _find_arg_value(cmdline, '--type=') is None:
                                     actual_proc = psutil.Process(proc.info['pid'])
                                     print(f"找到Profile {profile.name} 的进程: PID={proc.info['pid']}")
                                     return actual_proc
@@ -328,16 +374,16 @@ class BrowserManager:
             print(f"关闭浏览器时出错: {e}")
             return False
     
-    def close_all_browsers(self) -> bool:
-        """关闭所有浏览器实例"""
-        success = True
+    def close_all_browsers(self, max_workers: int = 8) -> bool:
+        """关闭所有浏览器实例（并行关闭，总耗时取决于最慢的实例）"""
         profile_names = list(self.running_instances.keys())
+        if not profile_names:
+            return True
         
-        for profile_name in profile_names:
-            if not self.close_browser(profile_name):
-                success = False
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(profile_names))) as executor:
+            results = list(executor.map(self.close_browser, profile_names))
         
-        return success
+        return all(results)
     
     def is_browser_running(self, profile_name: str) -> bool:
         """检查浏览器实例是否在运行"""
@@ -345,12 +391,17 @@ class BrowserManager:
         if profile_name in self.running_instances:
             instance = self.running_instances[profile_name]
             try:
-                # 检查进程是否还存在
-                return instance.process.is_running()
+                # 检查进程是否还存在（oneshot内存活与状态检查共用一次读取，僵尸进程视为已停止）
+                with instance.process.oneshot():
+                    return (instance.process.is_running()
+                            and instance.process.status() != psutil.STATUS_ZOMBIE)
             except psutil.NoSuchProcess:
                 # 进程已经不存在，从列表中移除
                 del self.running_instances[profile_name]
                 return False
+            except psutil.AccessDenied:
+                # 无权读取进程状态时，退回只检查进程是否存在
+                return instance.process.is_running()
         
         # 如果在已知实例中没有找到，尝试发现外部启动的浏览器
         # 为了准确检测，我们需要获取profiles列表
@@ -374,38 +425,35 @@ class BrowserManager:
                 f"Chrome_Instance_{profile_name}"
             )
             
-            # 检查所有Chrome进程
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+            # 检查所有Chrome进程（在process_snapshot()内时复用快照）
+            for entry in self._chrome_processes():
                 try:
-                    if not proc.info['name'] or 'chrome' not in proc.info['name'].lower():
-                        continue
-                        
-                    cmdline = proc.info['cmdline']
+                    cmdline = self._process_cmdline(entry)
                     if not cmdline:
                         continue
                     
-                    cmdline_str = ' '.join(cmdline)
-                    
                     # 跳过子进程
-                    if '--type=' in cmdline_str:
+                    if _find_arg_value(cmdline, '--type=') is not None:
                         continue
                     
+                    user_data_dir = _find_arg_value(cmdline, '--user-data-dir=')
+                    
                     # 检查是否使用了我们的独立用户数据目录
-                    if independent_user_data_dir in cmdline_str:
+                    if user_data_dir == independent_user_data_dir:
                         # 确认进程是否真的在运行
                         try:
-                            process = psutil.Process(proc.info['pid'])
+                            process = psutil.Process(entry['pid'])
                             if process.is_running() and process.status() != psutil.STATUS_ZOMBIE:
                                 return True
                         except (psutil.NoSuchProcess, psutil.AccessDenied):
                             continue
                     
                     # 检查是否使用了标准Profile目录
-                    profile_dir_arg = f"--profile-directory={profile_name}"
-                    if profile_dir_arg in cmdline_str and base_user_data_dir in cmdline_str:
+                    if (user_data_dir == base_user_data_dir
+                            and _find_arg_value(cmdline, '--profile-directory=') == profile_name):
                         # 确认进程是否真的在运行
                         try:
-                            process = psutil.Process(proc.info['pid'])
+                            process = psutil.Process(entry['pid'])
                             if process.is_running() and process.status() != psutil.STATUS_ZOMBIE:
                                 return True
                         except (psutil.NoSuchProcess, psutil.AccessDenied):
@@ -431,18 +479,20 @@ class BrowserManager:
         instance = self.running_instances[profile_name]
         
         try:
-            memory_info = instance.process.memory_info()
-            cpu_percent = instance.process.cpu_percent()
-            
-            return {
-                'pid': instance.process_id,
-                'start_time': instance.start_time,
-                'memory_usage': memory_info.rss,  # 物理内存使用量
-                'memory_percent': instance.process.memory_percent(),
-                'cpu_percent': cpu_percent,
-                'status': instance.process.status(),
-                'command_line': instance.command_line
-            }
+            # oneshot内多个字段共用一次系统调用的结果
+            with instance.process.oneshot():
+                memory_info = instance.process.memory_info()
+                cpu_percent = instance.process.cpu_percent()
+                
+                return {
+                    'pid': instance.process_id,
+                    'start_time': instance.start_time,
+                    'memory_usage': memory_info.rss,  # 物理内存使用量
+                    'memory_percent': instance.process.memory_percent(),
+                    'cpu_percent': cpu_percent,
+                    'status': instance.process.status(),
+                    'command_line': instance.command_line
+                }
         except Exception as e:
             print(f"获取浏览器信息时出错: {e}")
             return None
@@ -466,28 +516,29 @@ class BrowserManager:
             # 收集所有Chrome主进程
             chrome_main_processes = []
             
-            # 遍历所有Chrome进程
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'create_time']):
+            # 遍历所有Chrome进程（在process_snapshot()内时复用快照，命令行和创建时间只对Chrome进程读取）
+            for entry in self._chrome_processes():
                 try:
-                    if not proc.info['name']:
-                        continue
-                    
                     # 识别Google Chrome主进程
-                    if proc.info['name'] != 'Google Chrome':
+                    if entry['name'] != 'Google Chrome':
                         continue
                     
-                    cmdline = proc.info['cmdline']
-                    if not cmdline:
-                        continue
-                    
-                    cmdline_str = ' '.join(cmdline)
-                    
-                    # 跳过子进程（Helper, GPU等）
-                    if any(skip_type in cmdline_str for skip_type in ['--type=', 'Helper', 'GPU', 'Renderer', 'Plugin']):
-                        continue
+                    proc = entry['process']
+                    with proc.oneshot():
+                        cmdline = self._process_cmdline(entry)
+                        if not cmdline:
+                            continue
+                        
+                        cmdline_str = ' '.join(cmdline)
+                        
+                        # 跳过子进程（Helper, GPU等）
+                        if any(skip_type in cmdline_str for skip_type in ['--type=', 'Helper', 'GPU', 'Renderer', 'Plugin']):
+                            continue
+                        
+                        proc_info = {'pid': entry['pid'], 'name': entry['name'], 'create_time': proc.create_time()}
                     
                     chrome_main_processes.append({
-                        'proc_info': proc.info,
+                        'proc_info': proc_info,
                         'cmdline': cmdline,
                         'cmdline_str': cmdline_str
                     })
@@ -656,17 +707,18 @@ class BrowserManager:
         
         # 获取浏览器信息
         try:
-            memory_info = process.memory_info()
-            external_browsers[profile_name] = {
-                'pid': proc_info['pid'],
-                'start_time': proc_info['create_time'],
-                'memory_usage': memory_info.rss,
-                'memory_percent': process.memory_percent(),
-                'cpu_percent': 0.0,  # 初始CPU使用率为0
-                'status': process.status(),
-                'command_line': cmdline,
-                'discovered': True  # 标记为外部发现的
-            }
+            with process.oneshot():
+                memory_info = process.memory_info()
+                external_browsers[profile_name] = {
+                    'pid': proc_info['pid'],
+                    'start_time': proc_info['create_time'],
+                    'memory_usage': memory_info.rss,
+                    'memory_percent': process.memory_percent(),
+                    'cpu_percent': 0.0,  # 初始CPU使用率为0
+                    'status': process.status(),
+                    'command_line': cmdline,
+                    'discovered': True  # 标记为外部发现的
+                }
             
             print(f"发现外部Chrome实例: {profile_name} (PID: {proc_info['pid']})")
             
@@ -682,26 +734,28 @@ class BrowserManager:
         for profile_name in list(self.running_instances.keys()):
             instance = self.running_instances[profile_name]
             try:
-                # 检查进程是否还存在并运行
-                if not instance.process.is_running() or instance.process.status() == psutil.STATUS_ZOMBIE:
-                    print(f"检测到浏览器进程已停止: {profile_name} (PID: {instance.process_id})")
-                    stopped_profiles.append(profile_name)
-                else:
-                    # 进程存在，获取其信息
-                    try:
-                        memory_info = instance.process.memory_info()
-                        running_browsers[profile_name] = {
-                            'pid': instance.process_id,
-                            'start_time': instance.start_time,
-                            'memory_usage': memory_info.rss,
-                            'memory_percent': instance.process.memory_percent(),
-                            'cpu_percent': instance.process.cpu_percent(),
-                            'status': instance.process.status(),
-                            'command_line': instance.command_line
-                        }
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        print(f"无法获取浏览器进程信息，可能已停止: {profile_name} (PID: {instance.process_id})")
+                # oneshot内状态、内存等字段共用一次系统调用的结果
+                with instance.process.oneshot():
+                    # 检查进程是否还存在并运行
+                    if not instance.process.is_running() or instance.process.status() == psutil.STATUS_ZOMBIE:
+                        print(f"检测到浏览器进程已停止: {profile_name} (PID: {instance.process_id})")
                         stopped_profiles.append(profile_name)
+                    else:
+                        # 进程存在，获取其信息
+                        try:
+                            memory_info = instance.process.memory_info()
+                            running_browsers[profile_name] = {
+                                'pid': instance.process_id,
+                                'start_time': instance.start_time,
+                                'memory_usage': memory_info.rss,
+                                'memory_percent': instance.process.memory_percent(),
+                                'cpu_percent': instance.process.cpu_percent(),
+                                'status': instance.process.status(),
+                                'command_line': instance.command_line
+                            }
+                        except (psutil.NoSuchProcess, psutil.AccessDenied):
+                            print(f"无法获取浏览器进程信息，可能已停止: {profile_name} (PID: {instance.process_id})")
+                            stopped_profiles.append(profile_name)
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 # 进程已经不存在
                 print(f"浏览器进程不存在: {profile_name} (PID: {instance.process_id})")
@@ -737,7 +791,11 @@ class BrowserManager:
         for profile_name in list(self.running_instances.keys()):
             instance = self.running_instances[profile_name]
             try:
-                if not instance.process.is_running():
+                # 与is_browser_running一致：oneshot内检查存活和状态，僵尸进程视为已停止
+                with instance.process.oneshot():
+                    stopped = (not instance.process.is_running()
+                               or instance.process.status() == psutil.STATUS_ZOMBIE)
+                if stopped:
                     stopped_browsers.append(profile_name)
                     del self.running_instances[profile_name]
                     print(f"清理已停止的浏览器: {profile_name} (PID: {instance.process_id})")
@@ -14,6 +14,7 @@ from dataclasses import dataclass
 from typing import List, Dict, Optional
 from datetime import datetime
 import time
+from functools import lru_cache
 
 @dataclass
 class ProfileInfo:
@@ -269,7 +270,9 @@ class ProfileManager:
         """刷新Profile列表"""
         self.scan_profiles()
     
-    def format_size(self, size_bytes: int) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def format_size(size_bytes: int) -> str:
         """格式化文件大小显示"""
         if size_bytes == 0:
             return "0 B"
@@ -284,6 +287,12 @@ class ProfileManager:
         
         return f"{size:.1f} {size_names[i]}" 
     
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def format_time(dt: datetime) -> str:
+        """格式化时间显示（结果按时间缓存）"""
+        return dt.strftime("%Y-%m-%d %H:%M:%S")
+    
     def profile_exists(self, display_name: str) -> bool:
         """检查Profile显示名称是否已存在"""
         # 检查当前已扫描的profiles的显示名称
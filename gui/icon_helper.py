@@ -6,6 +6,7 @@
 """
 
 import os
+from functools import lru_cache
 from PyQt5.QtGui import QPixmap, QPainter, QIcon, QColor, QPen, QBrush
 from PyQt5.QtCore import Qt, QRect
 
@@ -82,9 +83,10 @@ def create_default_icon(size: int = 64) -> QPixmap:
     painter.end()
     return pixmap
 
+@lru_cache(maxsize=1)
 def get_application_icon() -> QIcon:
     """
-    获取应用程序图标
+    获取应用程序图标（首次调用后缓存，需在创建QApplication之后调用）
     
     Returns:
         QIcon对象
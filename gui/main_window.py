@@ -8,6 +8,9 @@
 import sys
 import os
 import time
+import operator
+import platform
+from contextlib import contextmanager
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, 
                             QSplitter, QListWidget, QListWidgetItem, QLabel, 
                             QPushButton, QGroupBox, QGridLayout, QTextEdit,
@@ -16,10 +19,17 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
                             QMessageBox, QInputDialog, QTabWidget, QScrollArea,
                             QFrame, QSizePolicy, QTreeWidget, QTreeWidgetItem,
                             QDialog, QDialogButtonBox, QFormLayout, QFileDialog)
-from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal, QSize, QTime
+from PyQt5.QtCore import (Qt, QTimer, QThread, pyqtSignal, QSize, QTime,
+                          QRunnable, QThreadPool)
 from PyQt5.QtGui import QIcon, QFont, QPalette, QColor, QPixmap
 import datetime
 
+# 可选依赖：安装了orjson时用于加速导出
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 导入核心模块
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.profile_manager import ProfileManager, ProfileInfo
@@ -27,6 +37,125 @@ from core.browser_manager import BrowserManager
 from core.config_manager import ConfigManager, ProfileConfig
 from gui.icon_helper import get_application_icon
 
+# 当前操作系统，进程运行期间不会改变
+_SYSTEM = platform.system()
+
+def _make_virtual_profile(name):
+    """为外部检测到、但不在已知列表中的浏览器创建虚拟Profile"""
+    return ProfileInfo(
+        name=name,
+        path=f"外部检测的{name}Profile",
+        display_name=f"{name} (外部检测)",
+        is_default=(name == "Default"),
+        created_time=None,
+        last_used_time=None,
+    )
+
+# 对话框公共样式，每个对话框只设置一次，控件通过objectName匹配
+_DIALOG_QSS = """
+    QTextEdit#infoBox {
+        font-family: 'Courier New', monospace;
+        font-size: 12px;
+        background-color: #f8f9fa;
+        border: 1px solid #dee2e6;
+        border-radius: 4px;
+        padding: 10px;
+    }
+    QWidget#warningBanner, QWidget#warningBanner QWidget {
+        background-color: #f8d7da;
+        border: 1px solid #f5c6cb;
+        border-radius: 6px;
+        margin-bottom: 15px;
+    }
+    QLabel#warningIcon {
+        font-size: 32px;
+    }
+    QLabel#warningTitle {
+        color: #dc3545;
+    }
+    QLabel#deleteItems {
+        margin: 3px 5px;
+        padding: 2px;
+        color: #495057;
+        font-size: 12px;
+    }
+    QLabel#finalWarning {
+        background-color: #fff3cd;
+        border: 1px solid #ffeaa7;
+        border-radius: 4px;
+        padding: 10px;
+        margin: 10px 0;
+        color: #856404;
+        font-size: 12px;
+    }
+    QPushButton#cancelBtn, QPushButton#deleteBtn {
+        color: white;
+        border: none;
+        padding: 8px 20px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton#cancelBtn {
+        background-color: #6c757d;
+    }
+    QPushButton#cancelBtn:hover {
+        background-color: #5a6268;
+    }
+    QPushButton#deleteBtn {
+        background-color: #dc3545;
+    }
+    QPushButton#deleteBtn:hover {
+        background-color: #c82333;
+    }
+    QPushButton#deleteBtn:disabled {
+        background-color: #6c757d;
+    }
+"""
+
+# 删除Profile确认对话框中列出的数据项
+_DELETE_ITEM_TEMPLATES = (
+    "整个Profile目录 ({size})",
+    "所有书签 ({bookmarks} 个)",
+    "所有扩展程序 ({extensions} 个)",
+    "所有已保存的登录信息和密码",
+    "完整的浏览历史记录",
+    "所有Cookie和网站数据",
+    "下载历史记录",
+    "所有个人设置和偏好",
+    "自动填充数据",
+    "已保存的信用卡信息",
+    "同步数据（如果已启用）",
+    "主题和自定义设置",
+)
+
+def _build_delete_details_group(profile, size_str):
+    """创建“将要删除的数据”分组，所有数据项放在同一个标签中"""
+    ctx = dict(size=size_str, bookmarks=profile.bookmarks_count,
+               extensions=profile.extensions_count)
+    items_label = QLabel("\n".join(f"• {tmpl.format(**ctx)}" for tmpl in _DELETE_ITEM_TEMPLATES))
+    items_label.setWordWrap(True)
+    items_label.setObjectName("deleteItems")
+    
+    details_layout = QVBoxLayout()
+    details_layout.addWidget(items_label)
+    details_group = QGroupBox("将要删除的数据")
+    details_group.setLayout(details_layout)
+    return details_group
+
+class BackgroundTask(QRunnable):
+    """在QThreadPool中执行的后台任务"""
+    
+    def __init__(self, func, *args):
+        super().__init__()
+        self.func = func
+        self.args = args
+    
+    def run(self):
+        try:
+            self.func(*self.args)
+        except Exception as e:
+            print(f"后台任务执行失败: {e}")
+
 class ProfileEditDialog(QDialog):
     """Profile编辑对话框"""
     
@@ -285,14 +414,12 @@ class ProfileEditDialog(QDialog):
             # 加载详细信息
             self.path_label.setText(self.profile.path)
             
-            from core.profile_manager import ProfileManager
-            pm = ProfileManager()
-            self.size_label.setText(pm.format_size(self.profile.storage_size))
+            self.size_label.setText(ProfileManager.format_size(self.profile.storage_size))
             self.bookmarks_label.setText(str(self.profile.bookmarks_count))
             self.extensions_label.setText(str(self.profile.extensions_count))
             
             if self.profile.created_time:
-                self.created_label.setText(self.profile.created_time.strftime("%Y-%m-%d %H:%M:%S"))
+                self.created_label.setText(ProfileManager.format_time(self.profile.created_time))
             else:
                 self.created_label.setText("未知")
     
@@ -408,6 +535,7 @@ class ProfileEditDialog(QDialog):
         
         # 创建详细的删除确认对话框
         dialog = QDialog(self)
+        dialog.setStyleSheet(_DIALOG_QSS)
         dialog.setWindowTitle("确认删除Profile")
         dialog.setFixedSize(600, 550)  # 增加窗口大小
         dialog.setModal(True)
@@ -420,27 +548,20 @@ class ProfileEditDialog(QDialog):
         warning_layout.setContentsMargins(10, 10, 10, 10)
         
         warning_icon = QLabel("⚠️")
-        warning_icon.setStyleSheet("font-size: 32px;")
+        warning_icon.setObjectName("warningIcon")
         warning_icon.setFixedSize(40, 40)
         warning_icon.setAlignment(Qt.AlignCenter)
         
         warning_title = QLabel("危险操作：删除Profile")
         warning_title.setFont(QFont("", 14, QFont.Bold))
-        warning_title.setStyleSheet("color: #dc3545;")
+        warning_title.setObjectName("warningTitle")
         
         warning_layout.addWidget(warning_icon)
         warning_layout.addWidget(warning_title)
         warning_layout.addStretch()
         
         warning_widget.setLayout(warning_layout)
-        warning_widget.setStyleSheet("""
-            QWidget {
-                background-color: #f8d7da;
-                border: 1px solid #f5c6cb;
-                border-radius: 6px;
-                margin-bottom: 15px;
-            }
-        """)
+        warning_widget.setObjectName("warningBanner")
         
         layout.addWidget(warning_widget)
         
@@ -450,44 +571,8 @@ class ProfileEditDialog(QDialog):
         layout.addWidget(info_label)
         
         # 详细信息
-        details_group = QGroupBox("将要删除的数据")
-        details_layout = QVBoxLayout()
-        
-        # 计算要删除的数据
-        from core.profile_manager import ProfileManager
-        pm = ProfileManager()
-        size_str = pm.format_size(self.profile.storage_size)
-        
-        delete_items = [
-            f"• 整个Profile目录 ({size_str})",
-            f"• 所有书签 ({self.profile.bookmarks_count} 个)",
-            f"• 所有扩展程序 ({self.profile.extensions_count} 个)",
-            "• 所有已保存的登录信息和密码",
-            "• 完整的浏览历史记录",
-            "• 所有Cookie和网站数据",
-            "• 下载历史记录",
-            "• 所有个人设置和偏好",
-            "• 自动填充数据",
-            "• 已保存的信用卡信息",
-            "• 同步数据（如果已启用）",
-            "• 主题和自定义设置"
-        ]
-        
-        for item in delete_items:
-            item_label = QLabel(item)
-            item_label.setWordWrap(True)
-            item_label.setStyleSheet("""
-                QLabel {
-                    margin: 3px 5px;
-                    padding: 2px;
-                    color: #495057;
-                    font-size: 12px;
-                }
-            """)
-            details_layout.addWidget(item_label)
-        
-        details_group.setLayout(details_layout)
-        layout.addWidget(details_group)
+        size_str = ProfileManager.format_size(self.profile.storage_size)
+        layout.addWidget(_build_delete_details_group(self.profile, size_str))
         
         # 最终警告
         final_warning = QLabel(
@@ -496,17 +581,7 @@ class ProfileEditDialog(QDialog):
             "如果此Profile已与Google账号同步，本地删除不会影响云端数据"
         )
         final_warning.setWordWrap(True)
-        final_warning.setStyleSheet("""
-            QLabel {
-                background-color: #fff3cd;
-                border: 1px solid #ffeaa7;
-                border-radius: 4px;
-                padding: 10px;
-                margin: 10px 0;
-                color: #856404;
-                font-size: 12px;
-            }
-        """)
+        final_warning.setObjectName("finalWarning")
         layout.addWidget(final_warning)
         
         # 确认输入
@@ -523,37 +598,10 @@ class ProfileEditDialog(QDialog):
         button_layout = QHBoxLayout()
         
         cancel_btn = QPushButton("取消")
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6c757d;
-                color: white;
-                border: none;
-                padding: 8px 20px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #5a6268;
-            }
-        """)
+        cancel_btn.setObjectName("cancelBtn")
         
         delete_btn = QPushButton("确认删除")
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #dc3545;
-                color: white;
-                border: none;
-                padding: 8px 20px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #c82333;
-            }
-            QPushButton:disabled {
-                background-color: #6c757d;
-            }
-        """)
+        delete_btn.setObjectName("deleteBtn")
         delete_btn.setEnabled(False)
         
         # 验证输入
@@ -889,6 +937,32 @@ class ProfileItemWidget(QWidget):
                 }
             """)
 
+class ProfileListItem(QListWidgetItem):
+    """Profile列表项，支持按自定义排序键原地排序"""
+    
+    def __init__(self, profile, is_running=False, browser_info=None):
+        super().__init__()
+        self.setData(Qt.UserRole, profile)
+        # 直接保存Profile引用，排序时避免每次经由data()取值
+        self.profile = profile
+        self.sort_key = None
+        # 运行状态和过渡状态保存在列表项上，控件按需创建时使用
+        self.is_running = is_running
+        self.browser_info = browser_info
+        self.transition_type = None
+    
+    def set_status(self, is_running, browser_info=None):
+        """保存运行状态（与ProfileItemWidget.update_status一致，同时清除过渡状态）"""
+        self.is_running = is_running
+        self.browser_info = browser_info
+        self.transition_type = None
+    
+    def __lt__(self, other):
+        other_key = getattr(other, 'sort_key', None)
+        if self.sort_key is None or other_key is None:
+            return super().__lt__(other)
+        return self.sort_key < other_key
+
 class ProfileListWidget(QListWidget):
     """自定义Profile列表控件"""
     
@@ -907,6 +981,17 @@ class ProfileListWidget(QListWidget):
         # 跟踪当前选中的项目
         self.current_selected_item = None
         
+        # 列表项控件只为可见行创建，由主窗口设置创建函数
+        self.item_widget_factory = None
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListWidget.Batched)
+        self.setBatchSize(30)
+        self._materialize_timer = QTimer(self)
+        self._materialize_timer.setSingleShot(True)
+        self._materialize_timer.setInterval(0)
+        self._materialize_timer.timeout.connect(self.materialize_visible_items)
+        self.verticalScrollBar().valueChanged.connect(self.schedule_materialize)
+        
         # 连接选中状态变化信号
         self.itemSelectionChanged.connect(self.on_selection_changed)
         
@@ -954,6 +1039,59 @@ class ProfileListWidget(QListWidget):
         else:
             self.current_selected_item = None
     
+    def schedule_materialize(self, *args):
+        """在下一次事件循环中为可见行创建控件"""
+        self._materialize_timer.start()
+    
+    def materialize_visible_items(self):
+        """为当前可见但尚未创建控件的行创建ProfileItemWidget"""
+        if self.item_widget_factory is None or self.count() == 0 or not self.isVisible():
+            return
+        
+        viewport = self.viewport()
+        top_item = self.itemAt(5, 5)
+        bottom_item = self.itemAt(5, viewport.height() - 1)
+        first_row = self.row(top_item) if top_item else 0
+        last_row = self.row(bottom_item) if bottom_item else self.count() - 1
+        
+        for row in range(first_row, last_row + 1):
+            item = self.item(row)
+            if self.itemWidget(item) is not None:
+                continue
+            item_widget = self.item_widget_factory(item)
+            self.setItemWidget(item, item_widget)
+            if item.isSelected():
+                item_widget.set_selected(True)
+    
+    def rowsInserted(self, parent, start, end):
+        super().rowsInserted(parent, start, end)
+        self.schedule_materialize()
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.schedule_materialize()
+    
+    def clear(self):
+        """清空列表（同时重置选中跟踪，避免引用已删除的项目）"""
+        self.current_selected_item = None
+        super().clear()
+    
+    @contextmanager
+    def batch_update(self):
+        """批量修改列表期间暂停重绘和信号，结束后统一刷新一次"""
+        sorting_enabled = self.isSortingEnabled()
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        self.setSortingEnabled(False)
+        try:
+            yield
+        finally:
+            self.setSortingEnabled(sorting_enabled)
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self.viewport().update()
+            self.schedule_materialize()
+    
     def dropEvent(self, event):
         """处理拖拽放置事件"""
         super().dropEvent(event)
@@ -1253,12 +1391,12 @@ class ProfileInfoWidget(QWidget):
         self.path_label.setText(profile.path)
         
         if profile.created_time:
-            self.created_label.setText(profile.created_time.strftime("%Y-%m-%d %H:%M:%S"))
+            self.created_label.setText(ProfileManager.format_time(profile.created_time))
         else:
             self.created_label.setText("未知")
         
         if profile.last_used_time:
-            self.used_label.setText(profile.last_used_time.strftime("%Y-%m-%d %H:%M:%S"))
+            self.used_label.setText(ProfileManager.format_time(profile.last_used_time))
         else:
             self.used_label.setText("未知")
         
@@ -1266,9 +1404,7 @@ class ProfileInfoWidget(QWidget):
         self.extensions_label.setText(str(profile.extensions_count))
         
         # 格式化存储大小
-        from core.profile_manager import ProfileManager
-        pm = ProfileManager()
-        self.size_label.setText(pm.format_size(profile.storage_size))
+        self.size_label.setText(ProfileManager.format_size(profile.storage_size))
         
         # 自动加载配置
         config = self.config_manager.load_config(profile.name)
@@ -1350,6 +1486,12 @@ class StatusMonitorWidget(QWidget):
 class MainWindow(QMainWindow):
     """主窗口"""
     
+    # 后台收集的系统信息文本
+    systemInfoReady = pyqtSignal(str)
+    
+    # 排序方式对应的显示名称
+    _SORT_NAMES = {'name': '名称', 'size': '大小', 'date': '日期'}
+    
     def __init__(self):
         super().__init__()
         print("开始初始化主窗口...")
@@ -1361,6 +1503,28 @@ class MainWindow(QMainWindow):
         # 初始化外部检查时间戳
         self._last_external_check = 0
         
+        # 最近一次状态刷新得到的运行中浏览器数量
+        self._running_browser_count = 0
+        
+        # 拖拽排序的延时保存，拖拽结束后只写一次文件
+        self._pending_order = None
+        self._order_save_timer = QTimer(self)
+        self._order_save_timer.setSingleShot(True)
+        self._order_save_timer.setInterval(300)
+        self._order_save_timer.timeout.connect(self._flush_profile_order)
+        # 排序写入使用单线程的专用线程池：多次保存按顺序执行，退出时只等待排序写入
+        self._order_save_pool = QThreadPool(self)
+        self._order_save_pool.setMaxThreadCount(1)
+        
+        # 合并短时间内的多次刷新请求，只重新加载一次列表
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(50)
+        self._reload_timer.timeout.connect(self.load_profiles)
+        
+        # 列表项统一高度，添加第一个列表项时按模板计算
+        self._profile_row_size = None
+        
         print("设置窗口图标...")
         # 设置窗口图标
         self.setWindowIcon(get_application_icon())
@@ -1549,6 +1713,7 @@ class MainWindow(QMainWindow):
         print("开始设置UI - 创建Profile列表...")
         # Profile列表
         self.profile_list = ProfileListWidget()
+        self.profile_list.item_widget_factory = self._create_profile_item_widget
         print("开始设置UI - 连接Profile列表信号...")
         self.profile_list.itemClicked.connect(self.on_profile_selected)
         self.profile_list.itemDoubleClicked.connect(self.on_profile_double_clicked)
@@ -1632,7 +1797,7 @@ class MainWindow(QMainWindow):
         
         refresh_action = QAction('刷新Profile列表', self)
         refresh_action.setShortcut('F5')
-        refresh_action.triggered.connect(self.load_profiles)
+        refresh_action.triggered.connect(self._request_reload)
         file_menu.addAction(refresh_action)
         
         file_menu.addSeparator()
@@ -1769,29 +1934,15 @@ class MainWindow(QMainWindow):
             print("应用保存的排序...")
             profiles = self.sort_profiles_by_saved_order(profiles)
             
-            self.profile_list.clear()
-            
-            # 只加载基本的Profile，不检查运行状态
-            for profile in profiles:
-                print(f"加载Profile: {profile.display_name}")
-                
-                # 创建ProfileItemWidget，初始状态为未运行
-                item_widget = ProfileItemWidget(profile, False, None)
-                
-                # 连接信号
-                item_widget.startRequested.connect(self.start_browser_from_profile)
-                item_widget.closeRequested.connect(self.close_browser_from_profile)
-                
-                # 创建列表项
-                item = QListWidgetItem()
-                item.setData(Qt.UserRole, profile)
+            with self.profile_list.batch_update():
+                self.profile_list.clear()
                 
-                # 设置项目大小
-                item.setSizeHint(item_widget.sizeHint())
-                
-                # 添加到列表
-                self.profile_list.addItem(item)
-                self.profile_list.setItemWidget(item, item_widget)
+                # 只加载基本的Profile，不检查运行状态
+                for profile in profiles:
+                    print(f"加载Profile: {profile.display_name}")
+                    
+                    # 初始状态为未运行
+                    self._add_profile_item(profile)
             
             self.status_message.setText(f"找到 {len(profiles)} 个Profile")
             print("Profile加载完成")
@@ -1841,8 +1992,19 @@ class MainWindow(QMainWindow):
             if profile:
                 profile_order.append(profile.name)
         
-        # 保存新的排序
-        self.config_manager.save_profile_order(profile_order)
+        # 延时保存新的排序，避免拖拽过程中频繁写文件
+        self._pending_order = profile_order
+        self._order_save_timer.start()
+    
+    def _flush_profile_order(self):
+        """将待保存的Profile排序交给后台线程写入"""
+        if self._pending_order is None:
+            return
+        
+        profile_order = self._pending_order
+        self._pending_order = None
+        self._order_save_pool.start(
+            BackgroundTask(self.config_manager.save_profile_order, profile_order))
         
         # 更新日志
         self.status_monitor.add_log(f"📋 Profile排序已更新")
@@ -1881,22 +2043,28 @@ class MainWindow(QMainWindow):
                                    QMessageBox.No)
         
         if reply == QMessageBox.Yes:
+            # 丢弃尚未写入的拖拽排序，避免重置后又被写回
+            self._order_save_timer.stop()
+            self._pending_order = None
+            
             # 删除排序文件
             order_file = os.path.join(self.config_manager.config_dir, "profile_order.json")
-            if os.path.exists(order_file):
-                try:
-                    os.remove(order_file)
-                    self.status_monitor.add_log("📋 Profile排序已重置")
-                    self.status_message.setText("Profile排序已重置")
-                    
-                    # 重新加载Profile列表
-                    self.load_profiles()
-                    
-                    QMessageBox.information(self, "成功", "Profile排序已重置为默认顺序")
-                except Exception as e:
-                    QMessageBox.critical(self, "错误", f"重置排序失败: {e}")
-            else:
+            try:
+                os.unlink(order_file)
+            except FileNotFoundError:
                 QMessageBox.information(self, "提示", "当前使用的就是默认排序")
+                return
+            except OSError as e:
+                QMessageBox.critical(self, "错误", f"重置排序失败: {e}")
+                return
+            
+            self.status_monitor.add_log("📋 Profile排序已重置")
+            self.status_message.setText("Profile排序已重置")
+            
+            # 重新加载Profile列表
+            self._request_reload()
+            
+            QMessageBox.information(self, "成功", "Profile排序已重置为默认顺序")
     
     def start_browser(self):
         """启动浏览器"""
@@ -1948,7 +2116,7 @@ class MainWindow(QMainWindow):
                 self.status_message.setText(f"✅ 已启动: {profile.display_name}")
                 
                 # 刷新Profile列表显示状态
-                self.load_profiles()
+                self._request_reload()
             else:
                 # 启动失败，清除过渡状态
                 self.clear_profile_transition_state(profile.name)
@@ -1973,7 +2141,7 @@ class MainWindow(QMainWindow):
         
         finally:
             # 刷新Profile列表以更新状态
-            self.load_profiles()
+            self._request_reload()
     
     def close_browser(self):
         """关闭浏览器"""
@@ -2015,11 +2183,18 @@ class MainWindow(QMainWindow):
         
         # 更新状态栏的系统信息
         self.total_profiles_label.setText(f"总Profile: {total_profiles}")
-        self.running_profiles_label.setText(f"运行中: {len(running_browsers)}")
+        self._running_browser_count = len(running_browsers)
+        self.running_profiles_label.setText(f"运行中: {self._running_browser_count}")
         self.total_memory_label.setText(f"内存: {total_memory:.1f} MB")
     
     def check_browser_status(self):
         """检查浏览器状态变化，处理外部关闭的情况"""
+        # 本轮检查中的外部浏览器发现和状态刷新共用一次进程遍历
+        with self.browser_manager.process_snapshot():
+            self._check_browser_status()
+    
+    def _check_browser_status(self):
+        """执行一轮浏览器状态检查"""
         # 检查并清理已停止的浏览器
         stopped_browsers = self.browser_manager.check_and_cleanup_stopped_browsers()
         
@@ -2067,7 +2242,7 @@ class MainWindow(QMainWindow):
         # 如果检测到状态变化，更新界面
         if need_update_ui:
             # 刷新Profile列表显示状态
-            self.load_profiles()
+            self._request_reload()
             
             # 立即更新状态监控
             self.update_status()
@@ -2075,16 +2250,25 @@ class MainWindow(QMainWindow):
             # 即使没有重大变化，也定期更新运行状态（内存使用等）
             self.update_running_profile_items()
     
-    def update_profile_item_status(self, profile_name, is_running, browser_info=None):
-        """更新特定Profile列表项的状态"""
+    def _find_profile_item(self, profile_name):
+        """查找特定Profile的列表项"""
         for i in range(self.profile_list.count()):
             item = self.profile_list.item(i)
             profile = item.data(Qt.UserRole)
             if profile and profile.name == profile_name:
-                item_widget = self.profile_list.itemWidget(item)
-                if isinstance(item_widget, ProfileItemWidget):
-                    item_widget.update_status(is_running, browser_info)
-                break
+                return item
+        return None
+    
+    def update_profile_item_status(self, profile_name, is_running, browser_info=None):
+        """更新特定Profile列表项的状态"""
+        item = self._find_profile_item(profile_name)
+        if item is None:
+            return
+        # 尚未创建控件的行在创建时使用列表项上的状态
+        item.set_status(is_running, browser_info)
+        item_widget = self.profile_list.itemWidget(item)
+        if isinstance(item_widget, ProfileItemWidget):
+            item_widget.update_status(is_running, browser_info)
     
     def update_running_profile_items(self):
         """更新所有运行中Profile的状态信息（内存使用等）"""
@@ -2095,24 +2279,18 @@ class MainWindow(QMainWindow):
                 item = self.profile_list.item(i)
                 profile = item.data(Qt.UserRole)
                 if profile:
+                    browser_info = running_browsers.get(profile.name)
+                    is_running = browser_info is not None
+                    
+                    # 只有状态发生变化或需要更新运行时信息（内存使用等）时才更新
+                    if item.is_running == is_running and not (is_running and browser_info):
+                        continue
+                    
+                    # 尚未创建控件的行在创建时使用列表项上的状态
+                    item.set_status(is_running, browser_info)
                     item_widget = self.profile_list.itemWidget(item)
                     if isinstance(item_widget, ProfileItemWidget):
-                        is_running = profile.name in running_browsers
-                        browser_info = running_browsers.get(profile.name) if is_running else None
-                        
-                        # 只有状态发生变化时才更新
-                        if item_widget.is_running != is_running:
-                            item_widget.update_status(is_running, browser_info)
-                        elif is_running and browser_info:
-                            # 更新运行时信息（内存使用等）
-                            item_widget.update_status(is_running, browser_info)
-    
-    def show_about(self):
-        """显示关于对话框"""
-        QMessageBox.about(self, "关于", 
-                         "多开浏览器管理工具 v1.0\n\n"
-                         "基于Python和PyQt5开发的Chrome浏览器Profile管理工具\n"
-                         "支持多个浏览器实例的独立管理和配置")
+                        item_widget.update_status(is_running, browser_info)
     
     def closeEvent(self, event):
         """程序关闭时的处理"""
@@ -2122,6 +2300,12 @@ class MainWindow(QMainWindow):
         if hasattr(self, 'status_check_timer'):
             self.status_check_timer.stop()
         
+        # 写入尚未保存的排序
+        if self._order_save_timer.isActive():
+            self._order_save_timer.stop()
+            self._flush_profile_order()
+        self._order_save_pool.waitForDone(3000)
+        
         reply = QMessageBox.question(self, "确认退出", "退出前是否关闭所有运行中的浏览器？",
                                    QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel,
                                    QMessageBox.Yes)
@@ -2141,6 +2325,8 @@ class MainWindow(QMainWindow):
 
     def start_browser_from_profile(self, profile):
         """从Profile对象启动浏览器"""
+        self._set_item_transition_state(profile.name, 'starting')
+        
         # 设置当前Profile以便获取配置
         self.profile_info.current_profile = profile
         self.profile_info.update_profile_info(profile)
@@ -2150,6 +2336,8 @@ class MainWindow(QMainWindow):
     
     def close_browser_from_profile(self, profile):
         """从Profile对象关闭浏览器"""
+        self._set_item_transition_state(profile.name, 'stopping')
+        
         # 检查浏览器是否在运行
         if not self.browser_manager.is_browser_running(profile.name):
             # 清除按钮的过渡状态
@@ -2164,23 +2352,62 @@ class MainWindow(QMainWindow):
             self.status_monitor.add_log(f"✅ 成功关闭浏览器: {profile.display_name}")
             self.status_message.setText(f"已关闭: {profile.display_name}")
             # 立即刷新列表
-            self.load_profiles()
+            self._request_reload()
         else:
             # 操作失败，清除过渡状态
             self.clear_profile_transition_state(profile.name)
             self.status_monitor.add_log(f"❌ 关闭浏览器失败: {profile.display_name}")
             QMessageBox.warning(self, "警告", f"关闭浏览器失败: {profile.display_name}")
     
+    def _set_item_transition_state(self, profile_name, transition_type):
+        """记录特定Profile的过渡状态，控件存在时同步显示"""
+        item = self._find_profile_item(profile_name)
+        if item is None:
+            return
+        item.transition_type = transition_type
+        item_widget = self.profile_list.itemWidget(item)
+        if isinstance(item_widget, ProfileItemWidget) and item_widget.transition_type != transition_type:
+            item_widget.set_transition_state(transition_type)
+    
     def clear_profile_transition_state(self, profile_name):
         """清除特定Profile的过渡状态"""
-        for i in range(self.profile_list.count()):
-            item = self.profile_list.item(i)
-            profile = item.data(Qt.UserRole)
-            if profile and profile.name == profile_name:
-                item_widget = self.profile_list.itemWidget(item)
-                if isinstance(item_widget, ProfileItemWidget):
-                    item_widget.clear_transition_state()
-                break
+        item = self._find_profile_item(profile_name)
+        if item is None:
+            return
+        item.transition_type = None
+        item_widget = self.profile_list.itemWidget(item)
+        if isinstance(item_widget, ProfileItemWidget):
+            item_widget.clear_transition_state()
+    
+    def _create_profile_item_widget(self, item):
+        """为列表项创建ProfileItemWidget（滚动到可见时调用）"""
+        profile = item.data(Qt.UserRole)
+        item_widget = ProfileItemWidget(profile, item.is_running, item.browser_info)
+        # 控件创建前收到的过渡状态
+        if item.transition_type:
+            item_widget.set_transition_state(item.transition_type)
+        
+        # 连接信号
+        item_widget.startRequested.connect(self.start_browser_from_profile)
+        item_widget.closeRequested.connect(self.close_browser_from_profile)
+        return item_widget
+    
+    def _add_profile_item(self, profile, is_running=False, browser_info=None):
+        """创建Profile列表项并添加到列表，控件在可见时才创建"""
+        item = ProfileListItem(profile, is_running, browser_info)
+        
+        # 所有行高度一致，只计算一次项目大小
+        if self._profile_row_size is None:
+            # 用与具体Profile无关的模板计算，按信息最全的运行中状态取大小
+            template_widget = ProfileItemWidget(
+                _make_virtual_profile("Profile"), True, {'pid': 0, 'memory_usage': 0})
+            self._profile_row_size = template_widget.sizeHint()
+            template_widget.deleteLater()
+        item.setSizeHint(self._profile_row_size)
+        
+        # 添加到列表
+        self.profile_list.addItem(item)
+        return item
     
     def close_all_browsers(self):
         """关闭所有浏览器"""
@@ -2203,7 +2430,7 @@ class MainWindow(QMainWindow):
             # 重新扫描Profile（强制刷新）
             self.profile_manager.scan_profiles()
             # 重新加载Profile列表
-            self.load_profiles()
+            self._request_reload()
             self.status_monitor.add_log("📋 Profile列表已刷新（新建Profile）")
     
     def edit_profile(self):
@@ -2226,44 +2453,9 @@ class MainWindow(QMainWindow):
         dialog = ProfileEditDialog(self, profile, self.profile_manager)
         if dialog.exec_() == QDialog.Accepted:
             # 重新加载Profile列表
-            self.load_profiles()
+            self._request_reload()
             self.status_monitor.add_log(f"📋 Profile已更新: {profile.display_name}")
     
-    def close_all_browsers(self):
-        """关闭所有浏览器"""
-        reply = QMessageBox.question(self, "确认", "确定要关闭所有运行中的浏览器吗？",
-                                   QMessageBox.Yes | QMessageBox.No,
-                                   QMessageBox.No)
-        
-        if reply == QMessageBox.Yes:
-            success = self.browser_manager.close_all_browsers()
-            if success:
-                self.status_monitor.add_log("关闭所有浏览器")
-                self.status_message.setText("已关闭所有浏览器")
-            else:
-                QMessageBox.warning(self, "警告", "部分浏览器关闭失败")
-    
-    def update_running_profile_items(self):
-        """更新所有运行中Profile的状态信息（内存使用等）"""
-        if hasattr(self.profile_manager, 'profiles'):
-            running_browsers = self.browser_manager.get_all_running_browsers(self.profile_manager.profiles)
-            
-            for i in range(self.profile_list.count()):
-                item = self.profile_list.item(i)
-                profile = item.data(Qt.UserRole)
-                if profile:
-                    item_widget = self.profile_list.itemWidget(item)
-                    if isinstance(item_widget, ProfileItemWidget):
-                        is_running = profile.name in running_browsers
-                        browser_info = running_browsers.get(profile.name) if is_running else None
-                        
-                        # 只有状态发生变化时才更新
-                        if item_widget.is_running != is_running:
-                            item_widget.update_status(is_running, browser_info)
-                        elif is_running and browser_info:
-                            # 更新运行时信息（内存使用等）
-                            item_widget.update_status(is_running, browser_info) 
-    
     def batch_delete_profiles(self):
         """批量删除Profile"""
         # 获取所有非默认Profile
@@ -2310,9 +2502,7 @@ class MainWindow(QMainWindow):
             checkbox = QCheckBox(f"{profile.display_name} ({profile.name})")
             
             # 添加Profile信息
-            from core.profile_manager import ProfileManager
-            pm = ProfileManager()
-            size_str = pm.format_size(profile.storage_size)
+            size_str = ProfileManager.format_size(profile.storage_size)
             info_text = f"  📁 {size_str} | 📚 {profile.bookmarks_count} 书签 | 🔌 {profile.extensions_count} 扩展"
             
             profile_widget = QWidget()
@@ -2420,7 +2610,7 @@ class MainWindow(QMainWindow):
                     QMessageBox.information(dialog, "成功", f"成功删除 {success_count} 个Profile")
                 
                 dialog.accept()
-                self.load_profiles()  # 刷新列表
+                self._request_reload()  # 刷新列表
         
         cancel_btn.clicked.connect(dialog.reject)
         delete_btn.clicked.connect(perform_batch_delete)
@@ -2476,11 +2666,20 @@ class MainWindow(QMainWindow):
                     }
                     profiles_data.append(profile_data)
                 
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump({
-                        'export_time': datetime.datetime.now().isoformat(),
-                        'profiles': profiles_data
-                    }, f, indent=2, ensure_ascii=False)
+                export_data = {
+                    'export_time': datetime.datetime.now().isoformat(),
+                    'profiles': profiles_data
+                }
+                
+                # 先在内存中完成紧凑编码（不缩进），再一次性写入文件
+                if orjson is not None:
+                    payload = orjson.dumps(export_data)
+                    with open(file_path, 'wb') as f:
+                        f.write(payload)
+                else:
+                    payload = json.dumps(export_data, ensure_ascii=False, separators=(',', ':'))
+                    with open(file_path, 'w', encoding='utf-8') as f:
+                        f.write(payload)
                 
                 QMessageBox.information(self, "成功", f"Profile列表已导出到:\n{file_path}")
                 
@@ -2492,59 +2691,43 @@ class MainWindow(QMainWindow):
         QMessageBox.information(self, "功能开发中", "书签导入功能正在开发中，敬请期待！")
     
     def sort_profiles(self, sort_by):
-        """排序Profile"""
-        profiles = []
-        for i in range(self.profile_list.count()):
-            item = self.profile_list.item(i)
-            profile = item.data(Qt.UserRole)
-            if profile:
-                profiles.append(profile)
-        
+        """排序Profile（原地移动列表项，不重新创建控件）"""
         if sort_by == 'name':
-            profiles.sort(key=lambda p: p.display_name.lower())
+            sort_key, order = (lambda p: p.display_name.lower()), Qt.AscendingOrder
         elif sort_by == 'size':
-            profiles.sort(key=lambda p: p.storage_size, reverse=True)
+            sort_key, order = operator.attrgetter('storage_size'), Qt.DescendingOrder
         elif sort_by == 'date':
-            profiles.sort(key=lambda p: p.created_time or datetime.min, reverse=True)
+            sort_key, order = (lambda p: p.created_time or datetime.datetime.min), Qt.DescendingOrder
+        else:
+            return
         
-        # 保存新的排序
-        profile_order = [profile.name for profile in profiles]
-        self.config_manager.save_profile_order(profile_order)
+        # 为每个列表项计算排序键，列表项控件随项目一起移动
+        items = [self.profile_list.item(i) for i in range(self.profile_list.count())]
+        for item in items:
+            item.sort_key = sort_key(item.profile)
         
-        # 重新排列列表
-        self.profile_list.clear()
-        running_browsers = self.browser_manager.get_all_running_browsers(profiles)
+        with self.profile_list.batch_update():
+            self.profile_list.sortItems(order)
         
-        for profile in profiles:
-            is_running = profile.name in running_browsers
-            browser_info = running_browsers.get(profile.name) if is_running else None
-            
-            item_widget = ProfileItemWidget(profile, is_running, browser_info)
-            item_widget.startRequested.connect(self.start_browser_from_profile)
-            item_widget.closeRequested.connect(self.close_browser_from_profile)
-            
-            item = QListWidgetItem()
-            item.setData(Qt.UserRole, profile)
-            item.setSizeHint(item_widget.sizeHint())
-            
-            self.profile_list.addItem(item)
-            self.profile_list.setItemWidget(item, item_widget)
+        # 保存新的排序
+        profile_order = [self.profile_list.item(i).profile.name
+                         for i in range(self.profile_list.count())]
+        self.config_manager.save_profile_order(profile_order)
         
-        sort_names = {'name': '名称', 'size': '大小', 'date': '日期'}
-        self.status_monitor.add_log(f"📋 Profile已按{sort_names[sort_by]}排序并保存")
-        self.status_message.setText(f"Profile已按{sort_names[sort_by]}排序并保存")
+        message = f"Profile已按{self._SORT_NAMES[sort_by]}排序并保存"
+        self.status_monitor.add_log(f"📋 {message}")
+        self.status_message.setText(message)
     
     def open_chrome_data_directory(self):
         """打开Chrome数据目录"""
         import subprocess
-        import platform
         
         if self.profile_manager.chrome_paths:
             chrome_path = self.profile_manager.chrome_paths[0]
             try:
-                if platform.system() == "Darwin":  # macOS
+                if _SYSTEM == "Darwin":  # macOS
                     subprocess.run(["open", chrome_path])
-                elif platform.system() == "Windows":
+                elif _SYSTEM == "Windows":
                     subprocess.run(["explorer", chrome_path])
                 else:  # Linux
                     subprocess.run(["xdg-open", chrome_path])
@@ -2555,60 +2738,28 @@ class MainWindow(QMainWindow):
         else:
             QMessageBox.warning(self, "警告", "未找到Chrome数据目录")
     
+    def _emit_system_info(self, *args):
+        """后台收集系统信息并通过信号送回界面线程"""
+        try:
+            from gui import system_info
+            info_text = system_info.collect(*args)
+        except Exception as e:
+            info_text = f"获取系统信息失败: {e}"
+        self.systemInfoReady.emit(info_text)
+    
     def show_system_info(self):
         """显示系统信息"""
-        import platform
-        import psutil
-        
         dialog = QDialog(self)
+        dialog.setStyleSheet(_DIALOG_QSS)
         dialog.setWindowTitle("系统信息")
         dialog.setFixedSize(500, 400)
         
         layout = QVBoxLayout()
         
-        info_text = f"""
-🖥️ 系统信息
-─────────────────────────
-操作系统: {platform.system()} {platform.release()}
-架构: {platform.machine()}
-Python版本: {platform.python_version()}
-
-💾 内存信息
-─────────────────────────
-总内存: {psutil.virtual_memory().total // (1024**3)} GB
-可用内存: {psutil.virtual_memory().available // (1024**3)} GB
-内存使用率: {psutil.virtual_memory().percent}%
-
-📁 Chrome路径
-─────────────────────────
-"""
-        
-        for i, path in enumerate(self.profile_manager.chrome_paths, 1):
-            info_text += f"路径 {i}: {path}\n"
-        
-        if not self.profile_manager.chrome_paths:
-            info_text += "未找到Chrome安装路径\n"
-        
-        info_text += f"""
-📊 Profile统计
-─────────────────────────
-总Profile数量: {len(self.profile_manager.profiles)}
-运行中的浏览器: {len(self.browser_manager.get_all_running_browsers())}
-"""
-        
         text_edit = QTextEdit()
-        text_edit.setPlainText(info_text)
+        text_edit.setPlainText("正在收集系统信息...")
         text_edit.setReadOnly(True)
-        text_edit.setStyleSheet("""
-            QTextEdit {
-                font-family: 'Courier New', monospace;
-                font-size: 12px;
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-                padding: 10px;
-            }
-        """)
+        text_edit.setObjectName("infoBox")
         
         layout.addWidget(text_edit)
         
@@ -2617,7 +2768,19 @@ Python版本: {platform.python_version()}
         layout.addWidget(close_btn)
         
         dialog.setLayout(layout)
+        
+        # 系统信息在后台收集，对话框先显示占位文本
+        # 运行中的浏览器数量取自最近一次状态刷新，避免在后台线程访问浏览器管理器
+        self.systemInfoReady.connect(text_edit.setPlainText)
+        QThreadPool.globalInstance().start(BackgroundTask(
+            self._emit_system_info,
+            list(self.profile_manager.chrome_paths),
+            len(self.profile_manager.profiles),
+            self._running_browser_count,
+        ))
+        
         dialog.exec_()
+        self.systemInfoReady.disconnect(text_edit.setPlainText)
     
     def show_preferences(self):
         """显示偏好设置"""
@@ -2626,6 +2789,7 @@ Python版本: {platform.python_version()}
     def show_shortcuts(self):
         """显示快捷键"""
         dialog = QDialog(self)
+        dialog.setStyleSheet(_DIALOG_QSS)
         dialog.setWindowTitle("快捷键")
         dialog.setFixedSize(500, 400)
         
@@ -2659,16 +2823,7 @@ F1              显示快捷键
         text_edit = QTextEdit()
         text_edit.setPlainText(shortcuts_text)
         text_edit.setReadOnly(True)
-        text_edit.setStyleSheet("""
-            QTextEdit {
-                font-family: 'Courier New', monospace;
-                font-size: 12px;
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-                padding: 10px;
-            }
-        """)
+        text_edit.setObjectName("infoBox")
         
         layout.addWidget(text_edit)
         
@@ -2735,6 +2890,7 @@ F1              显示快捷键
         
         # 创建详细的删除确认对话框
         dialog = QDialog(self)
+        dialog.setStyleSheet(_DIALOG_QSS)
         dialog.setWindowTitle("确认删除Profile")
         dialog.setFixedSize(600, 550)  # 增加窗口大小
         dialog.setModal(True)
@@ -2747,27 +2903,20 @@ F1              显示快捷键
         warning_layout.setContentsMargins(10, 10, 10, 10)
         
         warning_icon = QLabel("⚠️")
-        warning_icon.setStyleSheet("font-size: 32px;")
+        warning_icon.setObjectName("warningIcon")
         warning_icon.setFixedSize(40, 40)
         warning_icon.setAlignment(Qt.AlignCenter)
         
         warning_title = QLabel("危险操作：删除Profile")
         warning_title.setFont(QFont("", 14, QFont.Bold))
-        warning_title.setStyleSheet("color: #dc3545;")
+        warning_title.setObjectName("warningTitle")
         
         warning_layout.addWidget(warning_icon)
         warning_layout.addWidget(warning_title)
         warning_layout.addStretch()
         
         warning_widget.setLayout(warning_layout)
-        warning_widget.setStyleSheet("""
-            QWidget {
-                background-color: #f8d7da;
-                border: 1px solid #f5c6cb;
-                border-radius: 6px;
-                margin-bottom: 15px;
-            }
-        """)
+        warning_widget.setObjectName("warningBanner")
         
         layout.addWidget(warning_widget)
         
@@ -2777,44 +2926,8 @@ F1              显示快捷键
         layout.addWidget(info_label)
         
         # 详细信息
-        details_group = QGroupBox("将要删除的数据")
-        details_layout = QVBoxLayout()
-        
-        # 计算要删除的数据
-        from core.profile_manager import ProfileManager
-        pm = ProfileManager()
-        size_str = pm.format_size(profile.storage_size)
-        
-        delete_items = [
-            f"• 整个Profile目录 ({size_str})",
-            f"• 所有书签 ({profile.bookmarks_count} 个)",
-            f"• 所有扩展程序 ({profile.extensions_count} 个)",
-            "• 所有已保存的登录信息和密码",
-            "• 完整的浏览历史记录",
-            "• 所有Cookie和网站数据",
-            "• 下载历史记录",
-            "• 所有个人设置和偏好",
-            "• 自动填充数据",
-            "• 已保存的信用卡信息",
-            "• 同步数据（如果已启用）",
-            "• 主题和自定义设置"
-        ]
-        
-        for item in delete_items:
-            item_label = QLabel(item)
-            item_label.setWordWrap(True)
-            item_label.setStyleSheet("""
-                QLabel {
-                    margin: 3px 5px;
-                    padding: 2px;
-                    color: #495057;
-                    font-size: 12px;
-                }
-            """)
-            details_layout.addWidget(item_label)
-        
-        details_group.setLayout(details_layout)
-        layout.addWidget(details_group)
+        size_str = self.profile_manager.format_size(profile.storage_size)
+        layout.addWidget(_build_delete_details_group(profile, size_str))
         
         # 最终警告
         final_warning = QLabel(
@@ -2823,17 +2936,7 @@ F1              显示快捷键
             "如果此Profile已与Google账号同步，本地删除不会影响云端数据"
         )
         final_warning.setWordWrap(True)
-        final_warning.setStyleSheet("""
-            QLabel {
-                background-color: #fff3cd;
-                border: 1px solid #ffeaa7;
-                border-radius: 4px;
-                padding: 10px;
-                margin: 10px 0;
-                color: #856404;
-                font-size: 12px;
-            }
-        """)
+        final_warning.setObjectName("finalWarning")
         layout.addWidget(final_warning)
         
         # 确认输入
@@ -2850,37 +2953,10 @@ F1              显示快捷键
         button_layout = QHBoxLayout()
         
         cancel_btn = QPushButton("取消")
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6c757d;
-                color: white;
-                border: none;
-                padding: 8px 20px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #5a6268;
-            }
-        """)
+        cancel_btn.setObjectName("cancelBtn")
         
         delete_btn = QPushButton("确认删除")
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #dc3545;
-                color: white;
-                border: none;
-                padding: 8px 20px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #c82333;
-            }
-            QPushButton:disabled {
-                background-color: #6c757d;
-            }
-        """)
+        delete_btn.setObjectName("deleteBtn")
         delete_btn.setEnabled(False)
         
         # 验证输入
@@ -2913,7 +2989,7 @@ F1              显示快捷键
                     )
                     dialog.accept()
                     # 重新加载Profile列表
-                    self.load_profiles()
+                    self._request_reload()
                 else:
                     QMessageBox.critical(self, "删除失败", "❌ 删除Profile失败，请检查权限或重试")
             except Exception as e:
@@ -2924,6 +3000,10 @@ F1              显示快捷键
         # 显示对话框
         dialog.exec_()
 
+    def _request_reload(self):
+        """请求重新加载Profile列表（延时合并执行）"""
+        self._reload_timer.start()
+    
     def load_profiles(self):
         """加载Profile列表"""
         print("开始加载Profile...")
@@ -2942,78 +3022,35 @@ F1              显示快捷键
             running_browsers = self.browser_manager.get_all_running_browsers(profiles)
             print(f"检测到{len(running_browsers)}个运行中的浏览器")
             
-            # 创建Profile名称到Profile对象的映射
-            profile_map = {profile.name: profile for profile in profiles}
-            
-            self.profile_list.clear()
+            # 已知Profile名称集合，用于识别外部发现的浏览器
+            known_names = {profile.name for profile in profiles}
             
-            # 先处理已知的Profile
-            print("处理已知Profile...")
-            for i, profile in enumerate(profiles):
-                print(f"处理Profile {i+1}/{len(profiles)}: {profile.display_name}")
-                
-                # 检查运行状态
-                is_running = profile.name in running_browsers
-                browser_info = running_browsers.get(profile.name) if is_running else None
-                
-                # 创建ProfileItemWidget
-                item_widget = ProfileItemWidget(profile, is_running, browser_info)
+            with self.profile_list.batch_update():
+                self.profile_list.clear()
                 
-                # 连接信号
-                item_widget.startRequested.connect(self.start_browser_from_profile)
-                item_widget.closeRequested.connect(self.close_browser_from_profile)
-                
-                # 创建列表项
-                item = QListWidgetItem()
-                item.setData(Qt.UserRole, profile)
-                
-                # 设置项目大小
-                item.setSizeHint(item_widget.sizeHint())
-                
-                # 添加到列表
-                self.profile_list.addItem(item)
-                self.profile_list.setItemWidget(item, item_widget)
-            
-            # 处理外部发现的但不在已知Profile列表中的浏览器
-            print("处理外部发现的浏览器...")
-            discovered_profiles = 0
-            for browser_name, browser_info in running_browsers.items():
-                if browser_info.get('discovered') and browser_name not in profile_map:
-                    discovered_profiles += 1
-                    print(f"发现外部浏览器: {browser_name}")
+                # 先处理已知的Profile
+                print("处理已知Profile...")
+                for i, profile in enumerate(profiles):
+                    print(f"处理Profile {i+1}/{len(profiles)}: {profile.display_name}")
                     
-                    # 创建一个虚拟的Profile对象
-                    class VirtualProfile:
-                        def __init__(self, name):
-                            self.name = name
-                            self.display_name = f"{name} (外部检测)"
-                            self.path = f"外部检测的{name}Profile"
-                            self.bookmarks_count = 0
-                            self.extensions_count = 0
-                            self.storage_size = 0
-                            self.created_time = None
-                            self.last_used_time = None
-                            self.is_default = (name == "Default")
+                    # 检查运行状态
+                    browser_info = running_browsers.get(profile.name)
+                    is_running = browser_info is not None
                     
-                    virtual_profile = VirtualProfile(browser_name)
-                    
-                    # 创建ProfileItemWidget
-                    item_widget = ProfileItemWidget(virtual_profile, True, browser_info)
-                    
-                    # 连接信号
-                    item_widget.startRequested.connect(self.start_browser_from_profile)
-                    item_widget.closeRequested.connect(self.close_browser_from_profile)
-                    
-                    # 创建列表项
-                    item = QListWidgetItem()
-                    item.setData(Qt.UserRole, virtual_profile)
-                    
-                    # 设置项目大小
-                    item.setSizeHint(item_widget.sizeHint())
-                    
-                    # 添加到列表
-                    self.profile_list.addItem(item)
-                    self.profile_list.setItemWidget(item, item_widget)
+                    self._add_profile_item(profile, is_running, browser_info)
+                
+                # 处理外部发现的但不在已知Profile列表中的浏览器
+                print("处理外部发现的浏览器...")
+                discovered_profiles = 0
+                for browser_name, browser_info in running_browsers.items():
+                    if browser_info.get('discovered') and browser_name not in known_names:
+                        discovered_profiles += 1
+                        print(f"发现外部浏览器: {browser_name}")
+                        
+                        # 创建一个虚拟的Profile对象
+                        virtual_profile = _make_virtual_profile(browser_name)
+                        
+                        self._add_profile_item(virtual_profile, True, browser_info)
             
             total_profiles = len(profiles) + discovered_profiles
             self.status_message.setText(f"找到 {total_profiles} 个Profile")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+系统信息收集
+生成“系统信息”对话框显示的文本，只在打开对话框时才导入
+"""
+
+import platform
+
+# 系统信息文本模板
+SYSTEM_INFO_HEADER = """
+🖥️ 系统信息
+─────────────────────────
+操作系统: {system} {release}
+架构: {machine}
+Python版本: {python_version}
+
+💾 内存信息
+─────────────────────────
+总内存: {total_gb} GB
+可用内存: {available_gb} GB
+内存使用率: {percent}%
+
+📁 Chrome路径
+─────────────────────────"""
+
+SYSTEM_INFO_FOOTER = """
+📊 Profile统计
+─────────────────────────
+总Profile数量: {profile_count}
+运行中的浏览器: {running_count}
+"""
+
+def collect(chrome_paths, profile_count: int, running_count: int) -> str:
+    """
+    收集系统信息并格式化为文本
+    
+    Args:
+        chrome_paths: Chrome数据目录列表
+        profile_count: Profile总数
+        running_count: 运行中的浏览器数量
+        
+    Returns:
+        系统信息文本
+    """
+    import psutil
+    
+    vm = psutil.virtual_memory()
+    lines = [SYSTEM_INFO_HEADER.format(
+        system=platform.system(),
+        release=platform.release(),
+        machine=platform.machine(),
+        python_version=platform.python_version(),
+        total_gb=vm.total // (1024**3),
+        available_gb=vm.available // (1024**3),
+        percent=vm.percent,
+    )]
+    
+    if chrome_paths:
+        lines.extend(f"路径 {i}: {path}" for i, path in enumerate(chrome_paths, 1))
+    else:
+        lines.append("未找到Chrome安装路径")
+    
+    lines.append(SYSTEM_INFO_FOOTER.format(
+        profile_count=profile_count,
+        running_count=running_count,
+    ))
+    return "\n".join(lines)
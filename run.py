@@ -7,20 +7,13 @@
 
 import sys
 import os
+from importlib.util import find_spec
 
 def check_dependencies():
     """检查依赖包是否安装"""
-    missing_packages = []
-    
-    try:
-        import PyQt5
-    except ImportError:
-        missing_packages.append("PyQt5")
-    
-    try:
-        import psutil
-    except ImportError:
-        missing_packages.append("psutil")
+    # 只查找模块规格，不执行包的导入
+    missing_packages = [package for package in ("PyQt5", "psutil")
+                        if find_spec(package) is None]
     
     if missing_packages:
         print("错误: 缺少以下依赖包:")
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+测试脚本共用的Chrome命令行参数解析
+"""
+
+import sys
+
+TYPE_PREFIX = sys.intern('--type=')
+
+def parse_chrome_flags(cmdline, wanted=('--profile-directory', '--user-data-dir')):
+    """一次遍历命令行参数列表，取出所需参数的值
+    
+    同时支持 --flag=value 和 --flag value 两种写法，同名参数以第一次出现为准；
+    分离写法后面紧跟的是另一个 -- 参数时不把它当作值；
+    返回 {参数名: 值}，未出现的参数不在结果中
+    """
+    flags = set(wanted)
+    result = {}
+    pending = None
+    for arg in cmdline:
+        if pending is not None and not arg.startswith('--'):
+            result.setdefault(pending, arg)
+            pending = None
+        elif arg in flags:
+            pending = arg
+        else:
+            pending = None
+            name, sep, value = arg.partition('=')
+            if sep and name in flags:
+                result.setdefault(name, value)
+        if len(result) == len(flags):
+            break
+    return result
+
+# 辅助进程的 --type= 总在命令行最前面几个参数中
+_TYPE_SCAN_LIMIT = 10
+
+def is_helper_cmdline(cmdline):
+    """判断命令行是否属于Chrome辅助进程（renderer、gpu等，任何 --type= 取值都算）"""
+    return any(arg.startswith(TYPE_PREFIX) for arg in cmdline[:_TYPE_SCAN_LIMIT])
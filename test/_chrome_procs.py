@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+测试脚本共用的Chrome进程遍历、快照与等待工具
+"""
+
+import os
+import select
+import time
+import psutil
+from _chrome_args import is_helper_cmdline, parse_chrome_flags
+
+# Chrome主进程名称（macOS）
+CHROME_NAME = 'Google Chrome'
+
+def iter_chrome_mains(attrs=None):
+    """遍历Chrome主进程，逐个产出 (Process, 命令行参数列表, 附加属性字典)
+    
+    先只预取pid、ppid和名称：父进程也是Chrome的是辅助进程，直接跳过；
+    只有剩下的主进程才读取命令行和attrs指定的附加属性（同一个oneshot内）
+    """
+    chrome_procs = [proc for proc in psutil.process_iter(['pid', 'ppid', 'name'])
+                    if proc.info['name'] == CHROME_NAME]
+    chrome_pids = {proc.info['pid'] for proc in chrome_procs}
+    for proc in chrome_procs:
+        if proc.info['ppid'] in chrome_pids:
+            continue
+        try:
+            with proc.oneshot():
+                cmdline = proc.cmdline()
+                # 主进程退出后辅助进程会被init收养，仍按命令行排除
+                if not cmdline or is_helper_cmdline(cmdline):
+                    continue
+                info = {name: getattr(proc, name)() for name in attrs or ()}
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+        yield proc, cmdline, info
+
+def snapshot_chrome_mains():
+    """遍历一次系统进程，返回当前所有Chrome主进程
+    
+    每项包含pid、命令行参数列表、用户数据目录和Profile目录，
+    同一轮检查的各项判断都应复用这一份结果
+    """
+    chrome_processes = []
+    for proc, cmdline, _ in iter_chrome_mains():
+        # 一次遍历同时取出用户数据目录和Profile目录
+        flags = parse_chrome_flags(cmdline)
+        chrome_processes.append({
+            'pid': proc.pid,
+            'cmdline': cmdline,
+            'user_data_dir': flags.get('--user-data-dir'),
+            'profile_dir': flags.get('--profile-directory')
+        })
+    return chrome_processes
+
+def wait_for_any_exit(pids, timeout=None):
+    """等待任意一个进程退出，返回是否在timeout秒内有进程退出（timeout为None时一直等待）
+    
+    Linux使用pidfd、macOS/BSD使用kqueue，由内核直接通知退出事件；
+    都不可用时退回每100ms轮询一次
+    """
+    if hasattr(os, 'pidfd_open'):
+        fds = []
+        try:
+            for pid in pids:
+                fds.append(os.pidfd_open(pid))
+        except ProcessLookupError:
+            for fd in fds:
+                os.close(fd)
+            return True
+        except OSError:
+            # 内核不支持pidfd，退回轮询
+            for fd in fds:
+                os.close(fd)
+            fds = None
+        if fds is not None:
+            try:
+                readable, _, _ = select.select(fds, [], [], timeout)
+                return bool(readable)
+            finally:
+                for fd in fds:
+                    os.close(fd)
+    elif hasattr(select, 'kqueue'):
+        kq = select.kqueue()
+        try:
+            events = [select.kevent(pid,
+                                    filter=select.KQ_FILTER_PROC,
+                                    flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                                    fflags=select.KQ_NOTE_EXIT)
+                      for pid in pids]
+            try:
+                return bool(kq.control(events, len(events), timeout))
+            except ProcessLookupError:
+                return True
+        finally:
+            kq.close()
+    
+    deadline = None if timeout is None else time.monotonic() + timeout
+    try:
+        # Process对象只创建一次，每轮只读取一次状态
+        procs = [psutil.Process(pid) for pid in pids]
+        while True:
+            # 未回收的子进程会停留在僵尸状态，同样视为已退出
+            if any(proc.status() == psutil.STATUS_ZOMBIE for proc in procs):
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.1)
+    except psutil.NoSuchProcess:
+        return True
+
+def wait_for_exit(pid, timeout):
+    """等待单个进程退出，返回是否在timeout秒内退出"""
+    return wait_for_any_exit([pid], timeout)
+
+def wait_for_chrome_ready(process, user_data_dir, timeout):
+    """等待直接启动的Chrome就绪，返回 'ready'、'exited' 或 'timeout'
+    
+    Chrome就绪后会把用户数据目录下的SingletonLock指向"主机名-PID"；
+    交给已运行的实例处理时，启动进程会直接退出。
+    macOS/BSD用kqueue同时监听该目录的变化和启动进程的退出，其他平台每100ms检查一次
+    """
+    lock_path = os.path.join(user_data_dir, 'SingletonLock')
+    lock_suffix = f'-{process.pid}'
+    
+    def current_state():
+        if process.poll() is not None:
+            return 'exited'
+        try:
+            if os.readlink(lock_path).endswith(lock_suffix):
+                return 'ready'
+        except OSError:
+            pass
+        return None
+    
+    deadline = time.monotonic() + timeout
+    if hasattr(select, 'kqueue') and os.path.isdir(user_data_dir):
+        dir_fd = os.open(user_data_dir, os.O_RDONLY)
+        kq = select.kqueue()
+        try:
+            try:
+                kq.control([
+                    select.kevent(dir_fd,
+                                  filter=select.KQ_FILTER_VNODE,
+                                  flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                                  fflags=select.KQ_NOTE_WRITE),
+                    select.kevent(process.pid,
+                                  filter=select.KQ_FILTER_PROC,
+                                  flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                                  fflags=select.KQ_NOTE_EXIT),
+                ], 0, 0)
+            except ProcessLookupError:
+                process.wait()
+                return 'exited'
+            while True:
+                state = current_state()
+                if state:
+                    return state
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return 'timeout'
+                kq.control(None, 2, remaining)
+        finally:
+            kq.close()
+            os.close(dir_fd)
+    
+    while True:
+        state = current_state()
+        if state:
+            return state
+        if time.monotonic() >= deadline:
+            return 'timeout'
+        time.sleep(0.1)
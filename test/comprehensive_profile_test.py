@@ -7,75 +7,121 @@
 """
 
 import os
+import sys
 import time
-import psutil
+import contextlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
-from core.browser_manager import BrowserManager
-from core.profile_manager import ProfileManager
+from _chrome_args import parse_chrome_flags
+
+# Profile目录中需要检查的重要文件
+_IMPORTANT_FILES = ('Preferences', 'History', 'Bookmarks', 'Cookies')
+
+# 内存以字节保存，输出时再换算为MB
+_MB = 1 << 20
 
 class ProfileTester:
     def __init__(self):
+        # psutil和核心模块在使用时才导入，导入本模块本身不付出这部分开销
+        from core.browser_manager import BrowserManager
+        from core.profile_manager import ProfileManager
         self.bm = BrowserManager()
         self.pm = ProfileManager()
         self.test_results = {}
+        # chrome_snapshot() 期间共享的Chrome进程快照
+        self._snapshot = None
         
     def scan_all_profiles(self) -> List:
         """扫描所有可用的Profile"""
         print("=== 扫描系统中的所有Profile ===")
         profiles = self.pm.scan_profiles()
         
-        print(f"发现 {len(profiles)} 个Profile:")
+        # 先收集所有输出行，最后一次性写出
+        lines = [f"发现 {len(profiles)} 个Profile:"]
         for i, profile in enumerate(profiles, 1):
-            print(f"  {i:2d}. {profile.display_name} ({profile.name})")
-            print(f"      路径: {profile.path}")
-            print(f"      是否默认: {profile.is_default}")
+            lines.append(f"  {i:2d}. {profile.display_name} ({profile.name})")
+            lines.append(f"      路径: {profile.path}")
+            lines.append(f"      是否默认: {profile.is_default}")
             
-            # 检查Profile目录状态
-            if os.path.exists(profile.path):
-                try:
-                    files = os.listdir(profile.path)
-                    important_files = ['Preferences', 'History', 'Bookmarks', 'Cookies']
-                    existing_files = [f for f in important_files if f in files]
-                    print(f"      重要文件: {existing_files}")
-                except Exception as e:
-                    print(f"      无法读取目录: {e}")
-            else:
-                print(f"      ⚠️  Profile目录不存在")
-            print()
+            # 检查Profile目录状态（找齐全部重要文件后即停止遍历）
+            try:
+                found = set()
+                with os.scandir(profile.path) as entries:
+                    for entry in entries:
+                        if entry.name in _IMPORTANT_FILES:
+                            found.add(entry.name)
+                            if len(found) == len(_IMPORTANT_FILES):
+                                break
+                existing_files = [f for f in _IMPORTANT_FILES if f in found]
+                lines.append(f"      重要文件: {existing_files}")
+            except FileNotFoundError:
+                lines.append(f"      ⚠️  Profile目录不存在")
+            except Exception as e:
+                lines.append(f"      无法读取目录: {e}")
+            lines.append("")
         
+        sys.stdout.write('\n'.join(lines) + '\n')
         return profiles
     
-    def get_current_chrome_processes(self) -> List[Dict]:
-        """获取当前所有Chrome主进程"""
+    @contextlib.contextmanager
+    def chrome_snapshot(self):
+        """在with块内复用同一份Chrome进程列表，避免重复遍历系统进程"""
+        self._snapshot = self.get_current_chrome_processes(fresh=True)
+        try:
+            yield self._snapshot
+        finally:
+            self._snapshot = None
+    
+    def get_current_chrome_processes(self, fresh: bool = False) -> List[Dict]:
+        """获取当前所有Chrome主进程（快照有效时直接返回快照）"""
+        if self._snapshot is not None and not fresh:
+            return self._snapshot
+        
+        from _chrome_procs import iter_chrome_mains
         chrome_processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'create_time', 'memory_info']):
-            try:
-                if proc.info['name'] == 'Google Chrome':
-                    cmdline = proc.info['cmdline']
-                    if cmdline and not any('--type=' in arg for arg in cmdline):
-                        # 提取用户数据目录
-                        user_data_dir = "unknown"
-                        cmdline_str = ' '.join(cmdline)
-                        if '--user-data-dir=' in cmdline_str:
-                            start = cmdline_str.find('--user-data-dir=') + len('--user-data-dir=')
-                            end = cmdline_str.find(' ', start)
-                            if end == -1:
-                                end = len(cmdline_str)
-                            user_data_dir = cmdline_str[start:end]
-                        
-                        chrome_processes.append({
-                            'pid': proc.info['pid'],
-                            'cmdline': cmdline,
-                            'cmdline_str': cmdline_str,
-                            'user_data_dir': user_data_dir,
-                            'create_time': proc.info['create_time'],
-                            'memory_mb': round(proc.info['memory_info'].rss / 1024 / 1024, 1)
-                        })
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                continue
+        for proc, cmdline, info in iter_chrome_mains(['create_time', 'memory_info']):
+            # 一次遍历参数列表提取用户数据目录和Profile目录（路径中可能有空格）
+            flags = parse_chrome_flags(cmdline)
+            
+            chrome_processes.append({
+                'pid': proc.pid,
+                'cmdline': cmdline,
+                'user_data_dir': flags.get('--user-data-dir', "unknown"),
+                'profile_dir': flags.get('--profile-directory'),
+                'create_time': info['create_time'],
+                'memory_bytes': info['memory_info'].rss
+            })
         
         return chrome_processes
     
+    def wait_for_new_chrome(self, before_pids: set, timeout: float = 8.0) -> List[Dict]:
+        """轮询等待新的Chrome主进程出现（指数退避），返回最后一次扫描结果"""
+        deadline = time.monotonic() + timeout
+        interval = 0.05
+        while True:
+            processes = self.get_current_chrome_processes(fresh=True)
+            if any(p['pid'] not in before_pids for p in processes):
+                return processes
+            if time.monotonic() >= deadline:
+                return processes
+            time.sleep(interval)
+            interval = min(interval * 1.5, 0.5)
+    
+    def wait_for_quiesce(self, timeout: float):
+        """等待Chrome主进程列表稳定（连续两次扫描一致），最多等待timeout秒"""
+        deadline = time.monotonic() + timeout
+        last_pids = {p['pid'] for p in self.get_current_chrome_processes(fresh=True)}
+        while time.monotonic() < deadline:
+            time.sleep(0.5)
+            processes = self.get_current_chrome_processes(fresh=True)
+            pids = {p['pid'] for p in processes}
+            if pids == last_pids:
+                if self._snapshot is not None:
+                    self._snapshot = processes
+                return
+            last_pids = pids
+    
     def print_chrome_status(self, title: str):
         """打印当前Chrome进程状态"""
         print(f"\n=== {title} ===")
@@ -87,7 +133,7 @@ class ProfileTester:
             print(f"发现 {len(processes)} 个Chrome主进程:")
             for i, proc in enumerate(processes, 1):
                 print(f"  {i}. PID: {proc['pid']}")
-                print(f"     内存: {proc['memory_mb']} MB")
+                print(f"     内存: {proc['memory_bytes'] / _MB:.1f} MB")
                 print(f"     用户数据目录: {proc['user_data_dir']}")
                 print(f"     启动时间: {time.strftime('%H:%M:%S', time.localtime(proc['create_time']))}")
                 print()
@@ -98,6 +144,12 @@ class ProfileTester:
         print(f"测试 {test_index}/{total_tests}: {profile.display_name} ({profile.name})")
         print(f"{'='*60}")
         
+        # 丢弃上一轮测试缓存的Process对象（psutil 6.0+ 才有cache_clear）
+        import psutil
+        cache_clear = getattr(psutil.process_iter, 'cache_clear', None)
+        if cache_clear:
+            cache_clear()
+        
         # 记录测试开始时间
         start_time = time.time()
         
@@ -112,6 +164,7 @@ class ProfileTester:
         
         # 记录启动前的Chrome进程
         before_processes = self.get_current_chrome_processes()
+        before_pids = {bp['pid'] for bp in before_processes}
         print(f"启动前Chrome进程数: {len(before_processes)}")
         
         # 尝试启动Profile
@@ -125,14 +178,18 @@ class ProfileTester:
         # 计算启动耗时
         duration = time.time() - start_time
         
-        # 等待一段时间让Chrome稳定
+        # 等待新的Chrome主进程出现（检测到即返回，不再固定等待）
         if success:
-            print("⏳ 等待Chrome稳定...")
-            time.sleep(3)
+            print("⏳ 等待Chrome启动...")
+            after_processes = self.wait_for_new_chrome(before_pids)
+        else:
+            after_processes = self.get_current_chrome_processes(fresh=True)
         
         # 记录启动后的Chrome进程
-        after_processes = self.get_current_chrome_processes()
-        new_processes = [p for p in after_processes if p['pid'] not in [bp['pid'] for bp in before_processes]]
+        if self._snapshot is not None:
+            # 更新快照，后续读取（下一个测试的启动前状态等）直接复用
+            self._snapshot = after_processes
+        new_processes = [p for p in after_processes if p['pid'] not in before_pids]
         
         print(f"启动后Chrome进程数: {len(after_processes)}")
         print(f"新增进程数: {len(new_processes)}")
@@ -143,14 +200,14 @@ class ProfileTester:
                 print(f"✅ 启动成功!")
                 print(f"   PID: {new_proc['pid']}")
                 print(f"   用户数据目录: {new_proc['user_data_dir']}")
-                print(f"   内存使用: {new_proc['memory_mb']} MB")
+                print(f"   内存使用: {new_proc['memory_bytes'] / _MB:.1f} MB")
                 print(f"   启动耗时: {duration:.1f}秒")
                 
                 return {
                     'status': 'success',
                     'pid': new_proc['pid'],
                     'user_data_dir': new_proc['user_data_dir'],
-                    'memory_mb': new_proc['memory_mb'],
+                    'memory_bytes': new_proc['memory_bytes'],
                     'duration': duration,
                     'message': '启动成功'
                 }
@@ -171,34 +228,129 @@ class ProfileTester:
                 'message': '启动失败'
             }
     
-    def test_all_profiles(self, delay_between_tests: int = 5):
-        """测试所有Profile的启动"""
+    def launch_profile(self, profile, already_running=None):
+        """启动单个Profile（供并发测试使用），返回 (是否已在运行, 是否启动成功, 耗时)"""
+        if already_running is None:
+            already_running = self.bm.is_browser_running(profile.name)
+        if already_running:
+            return True, False, 0
+        start_time = time.time()
+        success = self.bm.start_browser(
+            profile,
+            language='zh-CN',
+            window_size=(1280, 720)
+        )
+        return False, success, time.time() - start_time
+    
+    def test_profiles_concurrently(self, profiles, max_concurrent: int = 3, timeout: float = 15.0) -> Dict[str, Dict]:
+        """并发启动多个Profile，按独立用户数据目录把新进程归属到各Profile"""
+        before_pids = {p['pid'] for p in self.get_current_chrome_processes(fresh=True)}
+        print(f"启动前Chrome进程数: {len(before_pids)}")
+        print(f"🚀 并发启动 {len(profiles)} 个Profile（最多同时 {max_concurrent} 个）...")
+        
+        # 启动前在同一份进程快照上检查所有Profile是否已在运行
+        with self.bm.process_snapshot():
+            already_running = [self.bm.is_browser_running(profile.name) for profile in profiles]
+        
+        with ThreadPoolExecutor(max_workers=min(max_concurrent, len(profiles))) as executor:
+            launches = list(executor.map(self.launch_profile, profiles, already_running))
+        
+        # 等待所有启动成功的Profile都出现对应的新主进程
+        pending = {profile.name for profile, (_, success, _) in zip(profiles, launches) if success}
+        # start_browser为每个Profile使用 Chrome_Instance_<名称> 独立目录，不传 --profile-directory
+        dir_to_profile = {f"Chrome_Instance_{name}": name for name in pending}
+        new_by_profile = {}
+        deadline = time.monotonic() + timeout
+        interval = 0.05
+        while True:
+            for proc in self.get_current_chrome_processes(fresh=True):
+                if proc['pid'] in before_pids:
+                    continue
+                name = dir_to_profile.get(os.path.basename(proc['user_data_dir']))
+                if name is not None:
+                    new_by_profile.setdefault(name, proc)
+            if pending <= new_by_profile.keys() or time.monotonic() >= deadline:
+                break
+            time.sleep(interval)
+            interval = min(interval * 1.5, 0.5)
+        
+        results = {}
+        for profile, (already_running, success, duration) in zip(profiles, launches):
+            if already_running:
+                result = {
+                    'status': 'already_running',
+                    'message': 'Profile已经在运行',
+                    'duration': 0
+                }
+            elif not success:
+                result = {
+                    'status': 'failed',
+                    'duration': duration,
+                    'message': '启动失败'
+                }
+            elif profile.name in new_by_profile:
+                new_proc = new_by_profile[profile.name]
+                result = {
+                    'status': 'success',
+                    'pid': new_proc['pid'],
+                    'user_data_dir': new_proc['user_data_dir'],
+                    'memory_bytes': new_proc['memory_bytes'],
+                    'duration': duration,
+                    'message': '启动成功'
+                }
+            else:
+                result = {
+                    'status': 'success_no_new_process',
+                    'duration': duration,
+                    'message': '启动成功但未检测到新进程'
+                }
+            results[profile.name] = result
+        
+        return results
+    
+    def test_all_profiles(self, delay_between_tests: int = 5, max_concurrent: int = 1):
+        """测试所有Profile的启动（max_concurrent大于1时并发启动）"""
         profiles = self.scan_all_profiles()
         
         if not profiles:
             print("没有找到任何Profile，测试结束")
             return
         
-        # 显示初始Chrome状态
-        self.print_chrome_status("测试开始前的Chrome进程状态")
+        if max_concurrent > 1:
+            self.print_chrome_status("测试开始前的Chrome进程状态")
+            results = self.test_profiles_concurrently(profiles, max_concurrent)
+            for profile in profiles:
+                self.test_results[profile.name] = {
+                    'profile': profile,
+                    'result': results[profile.name]
+                }
+            self.print_chrome_status("所有测试完成后的Chrome进程状态")
+            self.generate_test_report()
+            return
         
-        # 依次测试每个Profile
-        total_tests = len(profiles)
-        for i, profile in enumerate(profiles, 1):
-            # 测试单个Profile
-            result = self.test_single_profile(profile, i, total_tests)
-            self.test_results[profile.name] = {
-                'profile': profile,
-                'result': result
-            }
+        # 测试期间共享进程快照：每次启动后刷新一次，
+        # 状态打印和下一个测试的启动前记录都直接复用
+        with self.chrome_snapshot():
+            # 显示初始Chrome状态
+            self.print_chrome_status("测试开始前的Chrome进程状态")
             
-            # 如果不是最后一个测试，等待一段时间
-            if i < total_tests:
-                print(f"\n⏳ 等待 {delay_between_tests} 秒后测试下一个Profile...")
-                time.sleep(delay_between_tests)
-        
-        # 显示最终状态
-        self.print_chrome_status("所有测试完成后的Chrome进程状态")
+            # 依次测试每个Profile
+            total_tests = len(profiles)
+            for i, profile in enumerate(profiles, 1):
+                # 测试单个Profile
+                result = self.test_single_profile(profile, i, total_tests)
+                self.test_results[profile.name] = {
+                    'profile': profile,
+                    'result': result
+                }
+                
+                # 如果不是最后一个测试，等待Chrome进程稳定（最多delay_between_tests秒）
+                if i < total_tests:
+                    print(f"\n⏳ 等待Chrome进程稳定后测试下一个Profile（最多 {delay_between_tests} 秒）...")
+                    self.wait_for_quiesce(delay_between_tests)
+            
+            # 显示最终状态
+            self.print_chrome_status("所有测试完成后的Chrome进程状态")
         
         # 生成测试报告
         self.generate_test_report()
@@ -209,64 +361,67 @@ class ProfileTester:
         print("测试报告")
         print(f"{'='*80}")
         
-        success_count = 0
-        failed_count = 0
-        already_running_count = 0
+        # 一次遍历同时完成计数和失败项收集
+        counts = Counter()
+        failures = []
         
-        print(f"{'Profile名称':<20} {'状态':<15} {'PID':<8} {'内存(MB)':<10} {'耗时(秒)':<8} {'说明'}")
-        print("-" * 80)
+        # 表格各行先收集到列表，最后一次性写出
+        lines = [
+            f"{'Profile名称':<20} {'状态':<15} {'PID':<8} {'内存(MB)':<10} {'耗时(秒)':<8} {'说明'}",
+            "-" * 80,
+        ]
         
         for profile_name, test_data in self.test_results.items():
             profile = test_data['profile']
             result = test_data['result']
             
             status = result['status']
+            counts[status] += 1
+            if status == 'failed':
+                failures.append(profile)
             pid = result.get('pid', '-')
-            memory = result.get('memory_mb', '-')
+            memory_bytes = result.get('memory_bytes')
+            memory = f"{memory_bytes / _MB:.1f}" if memory_bytes is not None else '-'
             duration = f"{result['duration']:.1f}" if result['duration'] > 0 else '-'
             message = result['message']
             
             # 状态图标
             if status == 'success':
                 status_icon = "✅ 成功"
-                success_count += 1
             elif status == 'failed':
                 status_icon = "❌ 失败"
-                failed_count += 1
             elif status == 'already_running':
                 status_icon = "⚠️  已运行"
-                already_running_count += 1
             else:
                 status_icon = "❓ 未知"
             
-            print(f"{profile.display_name:<20} {status_icon:<15} {pid:<8} {memory:<10} {duration:<8} {message}")
+            lines.append(f"{profile.display_name:<20} {status_icon:<15} {pid:<8} {memory:<10} {duration:<8} {message}")
         
-        print("-" * 80)
+        lines.append("-" * 80)
+        sys.stdout.write('\n'.join(lines) + '\n')
         print(f"总计: {len(self.test_results)} 个Profile")
-        print(f"✅ 成功启动: {success_count}")
-        print(f"❌ 启动失败: {failed_count}")
-        print(f"⚠️  已在运行: {already_running_count}")
+        print(f"✅ 成功启动: {counts['success']}")
+        print(f"❌ 启动失败: {counts['failed']}")
+        print(f"⚠️  已在运行: {counts['already_running']}")
         
         # 显示运行中的实例
-        running_instances = list(self.bm.running_instances.keys())
+        running_instances = tuple(self.bm.running_instances)
         print(f"\n当前Browser Manager中的运行实例: {len(running_instances)}")
         for instance in running_instances:
             print(f"  - {instance}")
         
         # 问题分析
-        if failed_count > 0:
+        if failures:
             print(f"\n{'='*40}")
             print("失败原因分析")
             print(f"{'='*40}")
             
-            for profile_name, test_data in self.test_results.items():
-                if test_data['result']['status'] == 'failed':
-                    profile = test_data['profile']
-                    print(f"\n❌ {profile.display_name} ({profile.name}):")
-                    print(f"   - 检查Profile目录是否完整: {profile.path}")
-                    print(f"   - 检查是否有权限访问Profile目录")
-                    print(f"   - 检查Chrome是否正确安装")
-                    print(f"   - 查看系统日志获取更多信息")
+            for profile in failures:
+                print(f"\n❌ {profile.display_name} ({profile.name}):")
+                print(f"   - 检查Profile目录是否完整: {profile.path}")
+                print(f"   - 检查是否有权限访问Profile目录")
+                print(f"   - 检查Chrome是否正确安装")
+                print(f"   - 查看系统日志获取更多信息")
         
         print(f"\n测试完成! 🎉")
 
@@ -287,7 +442,7 @@ def main():
     
     # 开始测试
     try:
-        tester.test_all_profiles(delay_between_tests=3)
+        tester.test_all_profiles(delay_between_tests=3, max_concurrent=3)
     except KeyboardInterrupt:
         print("\n\n⚠️  测试被用户中断")
         tester.print_chrome_status("中断时的Chrome进程状态")
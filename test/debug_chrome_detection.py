@@ -8,8 +8,63 @@ Chrome进程检测诊断脚本
 import psutil
 import os
 import platform
+import re
 from core.browser_manager import BrowserManager
 from core.profile_manager import ProfileManager
+from _chrome_args import parse_chrome_flags
+
+# 子进程/Helper的命令行特征，一次正则搜索代替逐个子串判断
+_HELPER_RE = re.compile(r'--type=|Helper|GPU|Renderer|Plugin|Utility')
+
+def _is_chrome_name(name):
+    """宽泛匹配Chrome相关进程名"""
+    name = name.lower()
+    return 'chrome' in name or 'google' in name
+
+def _read_proc_cmdline(pid):
+    """直接读取/proc/<pid>/cmdline并拆分为参数列表"""
+    with open(f'/proc/{pid}/cmdline', 'rb') as f:
+        raw = f.read()
+    if not raw:
+        return []
+    if raw.endswith(b'\0'):
+        args = raw[:-1].split(b'\0')
+    else:
+        # 改写过进程标题的子进程用空格分隔参数
+        args = raw.split(b' ')
+    return [arg.decode('utf-8', 'replace') for arg in args]
+
+def _scan_chrome_processes_linux():
+    """Linux下绕过psutil，直接读取/proc筛选Chrome相关进程"""
+    chrome_processes = []
+    # scandir惰性遍历/proc，不生成完整的目录列表
+    with os.scandir('/proc') as entries:
+        for entry in entries:
+            pid = entry.name
+            if not pid.isdigit():
+                continue
+            try:
+                # 先用字节比较筛选，只有Chrome相关进程才解码名称
+                with open(f'/proc/{pid}/comm', 'rb') as f:
+                    raw_name = f.read().rstrip(b'\n')
+                lowered = raw_name.lower()
+                if b'chrome' not in lowered and b'google' not in lowered:
+                    continue
+                name = raw_name.decode('utf-8', 'replace')
+                cmdline = _read_proc_cmdline(pid)
+                # 只为筛选后的少量进程创建psutil.Process
+                create_time = psutil.Process(int(pid)).create_time()
+            except (OSError, psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            
+            chrome_processes.append({
+                'pid': int(pid),
+                'name': name,
+                'cmdline': cmdline,
+                'cmdline_str': ' '.join(cmdline),
+                'create_time': create_time
+            })
+    return chrome_processes
 
 def debug_chrome_processes():
     """详细分析所有Chrome相关进程"""
@@ -29,38 +84,28 @@ def debug_chrome_processes():
     
     # 收集所有可能的Chrome进程
     chrome_processes = []
-    all_processes = []
     
     print("=== 扫描所有进程 ===")
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'create_time']):
-        try:
-            if not proc.info['name']:
+    if platform.system() == "Linux":
+        chrome_processes = _scan_chrome_processes_linux()
+    else:
+        # 只预取名称，命令行和创建时间只对Chrome相关进程读取
+        for proc in psutil.process_iter(['pid', 'name']):
+            name = proc.info['name']
+            if not name or not _is_chrome_name(name):
+                continue
+            try:
+                with proc.oneshot():
+                    cmdline = proc.cmdline() or []
+                    chrome_processes.append({
+                        'pid': proc.info['pid'],
+                        'name': name,
+                        'cmdline': cmdline,
+                        'cmdline_str': ' '.join(cmdline),
+                        'create_time': proc.create_time()
+                    })
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 continue
-                
-            process_name = proc.info['name'].lower()
-            
-            # 收集所有进程信息用于分析
-            all_processes.append({
-                'pid': proc.info['pid'],
-                'name': proc.info['name'],
-                'cmdline': proc.info['cmdline'] or []
-            })
-            
-            # 识别Chrome相关进程（更宽泛的匹配）
-            if any(keyword in process_name for keyword in ['chrome', 'google']):
-                cmdline = proc.info['cmdline'] or []
-                cmdline_str = ' '.join(cmdline) if cmdline else ''
-                
-                chrome_processes.append({
-                    'pid': proc.info['pid'],
-                    'name': proc.info['name'],
-                    'cmdline': cmdline,
-                    'cmdline_str': cmdline_str,
-                    'create_time': proc.info['create_time']
-                })
-                
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            continue
     
     print(f"找到 {len(chrome_processes)} 个Chrome相关进程:")
     print()
@@ -79,8 +124,7 @@ def debug_chrome_processes():
             print(f"  完整命令行: {proc_info['cmdline_str']}")
             
             # 分析是否是主进程还是子进程
-            is_helper = any(helper_type in proc_info['cmdline_str'] for helper_type in 
-                          ['--type=', 'Helper', 'GPU', 'Renderer', 'Plugin', 'Utility'])
+            is_helper = _HELPER_RE.search(proc_info['cmdline_str']) is not None
             
             if is_helper:
                 helper_processes.append(proc_info)
@@ -89,22 +133,17 @@ def debug_chrome_processes():
                 main_processes.append(proc_info)
                 print(f"  类型: 主进程")
                 
-                # 分析Profile信息
-                if '--user-data-dir=' in proc_info['cmdline_str']:
-                    import re
-                    user_data_match = re.search(r'--user-data-dir=([^\s]+)', proc_info['cmdline_str'])
-                    if user_data_match:
-                        user_data_path = user_data_match.group(1)
-                        print(f"  用户数据目录: {user_data_path}")
+                # 分析Profile信息（一次遍历取出两个参数）
+                flags = parse_chrome_flags(proc_info['cmdline'])
+                user_data_path = flags.get('--user-data-dir')
+                if user_data_path:
+                    print(f"  用户数据目录: {user_data_path}")
                 
-                if '--profile-directory=' in proc_info['cmdline_str']:
-                    import re
-                    profile_match = re.search(r'--profile-directory=([^\s]+)', proc_info['cmdline_str'])
-                    if profile_match:
-                        profile_name = profile_match.group(1)
-                        print(f"  Profile目录: {profile_name}")
-                    else:
-                        print(f"  Profile目录: Default (未指定)")
+                profile_name = flags.get('--profile-directory')
+                if profile_name:
+                    print(f"  Profile目录: {profile_name}")
+                elif profile_name is not None:
+                    print(f"  Profile目录: Default (未指定)")
                 else:
                     print(f"  Profile目录: Default (默认)")
         else:
@@ -128,6 +167,7 @@ def debug_chrome_processes():
     browser_manager = BrowserManager()
     profile_manager = ProfileManager()
     
+    # 只扫描一次Profile，结果直接传给下面两个检测方法
     profiles = profile_manager.scan_profiles()
     print(f"找到 {len(profiles)} 个Profile")
     
@@ -175,7 +215,7 @@ def debug_chrome_processes():
                     print(f"      实际: {cmdline_str}")
                 
                 # 检查是否是子进程
-                if any(skip_type in cmdline_str for skip_type in ['--type=', 'Helper', 'GPU', 'Renderer', 'Plugin']):
+                if _HELPER_RE.search(cmdline_str):
                     print(f"  ❌ 被识别为子进程")
                 else:
                     print(f"  ✅ 不是子进程")
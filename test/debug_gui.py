@@ -8,7 +8,6 @@ Debug版本的GUI，用于查看按钮显示问题
 import sys
 import os
 from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QLabel, QPushButton
-from PyQt5.QtCore import Qt
 
 # 导入核心模块
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -5,6 +5,7 @@
 """
 
 import time
+from _chrome_procs import wait_for_any_exit
 from core.browser_manager import BrowserManager
 from core.profile_manager import ProfileManager
 
@@ -26,7 +27,7 @@ def test_browser_detection():
         print(f"  - {profile.display_name} ({profile.name})")
     
     print("\n=== 当前运行状态 ===")
-    running_browsers = browser_manager.get_all_running_browsers()
+    running_browsers = browser_manager.get_all_running_browsers(profiles)
     print(f"运行中的浏览器: {len(running_browsers)}")
     for name, info in running_browsers.items():
         print(f"  - {name}: PID={info['pid']}, 内存={info['memory_usage']/(1024*1024):.1f}MB")
@@ -35,8 +36,24 @@ def test_browser_detection():
     print("手动关闭浏览器窗口，观察检测结果...")
     print("按 Ctrl+C 退出监控")
     
+    # 最多阻塞这么久就重新发现一次外部启动的浏览器
+    discover_interval = 5
+    
     try:
         while True:
+            # 阻塞等待任一已跟踪的浏览器进程退出（内核通知，空闲时不占CPU）；
+            # 超时或没有可跟踪的进程时，重新发现新启动的浏览器并加入跟踪
+            tracked_pids = [instance.process_id for instance in browser_manager.running_instances.values()]
+            if tracked_pids:
+                exited = wait_for_any_exit(tracked_pids, discover_interval)
+            else:
+                time.sleep(2)
+                exited = False
+            
+            if not exited:
+                browser_manager.discover_external_browsers(profiles)
+                continue
+            
             # 检查状态变化
             stopped_browsers = browser_manager.check_and_cleanup_stopped_browsers()
             
@@ -44,18 +61,16 @@ def test_browser_detection():
                 print(f"\n🔴 检测到浏览器关闭: {stopped_browsers}")
                 
                 # 显示当前状态
-                current_running = browser_manager.get_all_running_browsers()
+                current_running = browser_manager.get_all_running_browsers(profiles)
                 print(f"   当前运行中: {len(current_running)} 个")
                 for name, info in current_running.items():
                     print(f"     - {name}: PID={info['pid']}")
             
-            time.sleep(2)  # 每2秒检查一次
-            
     except KeyboardInterrupt:
         print("\n\n监控已停止")
         
         # 最终状态
-        final_running = browser_manager.get_all_running_browsers()
+        final_running = browser_manager.get_all_running_browsers(profiles)
         print(f"最终运行中的浏览器: {len(final_running)} 个")
 
 if __name__ == "__main__":
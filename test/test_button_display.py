@@ -7,12 +7,9 @@
 
 import sys
 import os
-from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout
-from PyQt5.QtCore import Qt
 
 # 导入核心模块
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from gui.main_window import ProfileItemWidget
 
 # 创建虚拟Profile对象
 class TestProfile:
@@ -24,6 +21,10 @@ class TestProfile:
 
 def test_button_display():
     """测试按钮显示"""
+    # PyQt5和主窗口模块只在真正运行测试时导入
+    from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout
+    from gui.main_window import ProfileItemWidget
+    
     app = QApplication(sys.argv)
     
     # 创建测试窗口
@@ -7,43 +7,18 @@
 
 import subprocess
 import time
-import psutil
-
-def get_chrome_processes():
-    """获取Chrome主进程"""
-    chrome_processes = []
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-        try:
-            if proc.info['name'] == 'Google Chrome':
-                cmdline = proc.info['cmdline']
-                if cmdline and not any('--type=' in arg for arg in cmdline):
-                    chrome_processes.append({
-                        'pid': proc.info['pid'],
-                        'cmdline': ' '.join(cmdline)
-                    })
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            continue
-    return chrome_processes
-
-def extract_profile_from_cmdline(cmdline_list):
-    """从命令行中提取Profile名称"""
-    for i, arg in enumerate(cmdline_list):
-        if arg == '--profile-directory' and i + 1 < len(cmdline_list):
-            return cmdline_list[i + 1]
-        elif arg.startswith('--profile-directory='):
-            return arg.split('=', 1)[1]
-    return "Default"
+from _chrome_procs import snapshot_chrome_mains
 
 print("=== 测试双Profile启动 ===")
 
 print("1. 检查当前Chrome进程:")
-initial_processes = get_chrome_processes()
+initial_processes = snapshot_chrome_mains()
 for proc in initial_processes:
-    cmdline_list = proc['cmdline'].split()
-    profile = extract_profile_from_cmdline(cmdline_list)
+    profile = proc['profile_dir'] or "Default"
     print(f"   PID: {proc['pid']}, Profile: {profile}")
 
 print(f"当前Chrome主进程数: {len(initial_processes)}")
+initial_pids = {p['pid'] for p in initial_processes}
 
 print("\n2. 尝试启动Profile 2...")
 
@@ -68,44 +43,49 @@ try:
     
     print(f"启动进程PID: {process.pid}")
     
-    # 等待Chrome启动
+    # 等待Chrome启动：100ms轮询，出现新主进程即结束，最多等待10秒
     print("等待Chrome启动...")
-    for i in range(10):
-        time.sleep(1)
-        current_processes = get_chrome_processes()
+    deadline = time.monotonic() + 10
+    check_count = 0
+    launcher_exited = False
+    while time.monotonic() < deadline:
+        check_count += 1
+        current_processes = snapshot_chrome_mains()
+        new_processes = [p for p in current_processes if p['pid'] not in initial_pids]
         
-        print(f"第{i+1}次检查: 找到{len(current_processes)}个Chrome主进程")
+        if new_processes:
+            print(f"第{check_count}次检查: 找到{len(current_processes)}个Chrome主进程")
+            for proc in current_processes:
+                profile = proc['profile_dir'] or "Default"
+                marker = " [新]" if proc['pid'] not in initial_pids else ""
+                print(f"   PID: {proc['pid']}, Profile: {profile}{marker}")
+            break
         
-        for proc in current_processes:
-            cmdline_list = proc['cmdline'].split()
-            profile = extract_profile_from_cmdline(cmdline_list)
-            is_new = proc['pid'] not in [p['pid'] for p in initial_processes]
-            marker = " [新]" if is_new else ""
-            print(f"   PID: {proc['pid']}, Profile: {profile}{marker}")
-        
-        # 检查启动进程状态
-        try:
-            if process.poll() is not None:
-                stdout, stderr = process.communicate()
-                print(f"启动进程已退出，返回码: {process.returncode}")
-                if stdout:
-                    print(f"stdout: {stdout.decode()}")
-                if stderr:
-                    print(f"stderr: {stderr.decode()}")
+        # 检查启动进程状态（open -n 通常很快退出，正常退出时继续等待新进程）
+        if not launcher_exited and process.poll() is not None:
+            launcher_exited = True
+            stdout, stderr = process.communicate()
+            print(f"启动进程已退出，返回码: {process.returncode}")
+            if stdout:
+                print(f"stdout: {stdout.decode()}")
+            if stderr:
+                print(f"stderr: {stderr.decode()}")
+            if process.returncode != 0:
                 break
-        except:
-            pass
         
-        print()
+        time.sleep(0.1)
+    else:
+        print(f"等待超时: 共检查{check_count}次，未发现新的Chrome主进程")
+    
+    print()
 
 except Exception as e:
     print(f"启动失败: {e}")
 
 print("\n3. 最终状态:")
-final_processes = get_chrome_processes()
+final_processes = snapshot_chrome_mains()
 for proc in final_processes:
-    cmdline_list = proc['cmdline'].split()
-    profile = extract_profile_from_cmdline(cmdline_list)
+    profile = proc['profile_dir'] or "Default"
     print(f"   PID: {proc['pid']}, Profile: {profile}")
 
 print(f"最终Chrome主进程数: {len(final_processes)}") 
\ No newline at end of file
@@ -6,45 +6,26 @@
 """
 
 import subprocess
+import tempfile
 import time
-import psutil
 import os
-
-def get_chrome_processes():
-    """获取Chrome主进程"""
-    chrome_processes = []
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-        try:
-            if proc.info['name'] == 'Google Chrome':
-                cmdline = proc.info['cmdline']
-                if cmdline and not any('--type=' in arg for arg in cmdline):
-                    chrome_processes.append({
-                        'pid': proc.info['pid'],
-                        'cmdline': ' '.join(cmdline)
-                    })
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            continue
-    return chrome_processes
-
-def extract_profile_from_cmdline(cmdline_list):
-    """从命令行中提取Profile名称"""
-    for i, arg in enumerate(cmdline_list):
-        if arg == '--profile-directory' and i + 1 < len(cmdline_list):
-            return cmdline_list[i + 1]
-        elif arg.startswith('--profile-directory='):
-            return arg.split('=', 1)[1]
-    return "Default"
+import sys
+from _chrome_procs import snapshot_chrome_mains, wait_for_chrome_ready
 
 print("=== 测试多种Chrome启动方法 ===")
 
 print("1. 检查当前Chrome进程:")
-initial_processes = get_chrome_processes()
+initial_processes = snapshot_chrome_mains()
+# 进程列表先收集成行，再一次性写出
+lines = []
 for proc in initial_processes:
-    cmdline_list = proc['cmdline'].split()
-    profile = extract_profile_from_cmdline(cmdline_list)
-    print(f"   PID: {proc['pid']}, Profile: {profile}")
+    profile = proc['profile_dir'] or "Default"
+    lines.append(f"   PID: {proc['pid']}, Profile: {profile}")
+if lines:
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 print(f"当前Chrome主进程数: {len(initial_processes)}")
+initial_pids = {p['pid'] for p in initial_processes}
 
 # 方法1：直接调用Chrome可执行文件
 print("\n2. 方法1: 直接调用Chrome可执行文件...")
@@ -66,43 +47,42 @@ cmd1 = [
 print(f"启动命令: {' '.join(cmd1)}")
 
 try:
+    # Chrome输出很多日志，管道不读取会写满阻塞；stdout丢弃，stderr写入临时文件供退出时查看
+    stderr_file1 = tempfile.TemporaryFile()
     process1 = subprocess.Popen(cmd1, 
-                               stdout=subprocess.PIPE, 
-                               stderr=subprocess.PIPE,
+                               stdout=subprocess.DEVNULL, 
+                               stderr=stderr_file1,
                                start_new_session=True)
     
     print(f"启动进程PID: {process1.pid}")
     
-    # 等待Chrome启动
+    # 等待Chrome启动：SingletonLock指向新进程或启动进程退出时立即返回，最多8秒
     print("等待Chrome启动...")
-    for i in range(8):
-        time.sleep(1)
-        current_processes = get_chrome_processes()
-        
-        print(f"第{i+1}次检查: 找到{len(current_processes)}个Chrome主进程")
-        
-        for proc in current_processes:
-            cmdline_list = proc['cmdline'].split()
-            profile = extract_profile_from_cmdline(cmdline_list)
-            is_new = proc['pid'] not in [p['pid'] for p in initial_processes]
-            marker = " [新]" if is_new else ""
-            print(f"   PID: {proc['pid']}, Profile: {profile}{marker}")
-        
-        # 检查启动进程状态
-        try:
-            poll_result = process1.poll()
-            if poll_result is not None:
-                stdout, stderr = process1.communicate()
-                print(f"启动进程已退出，返回码: {poll_result}")
-                if stdout:
-                    print(f"stdout: {stdout.decode()}")
-                if stderr:
-                    print(f"stderr: {stderr.decode()}")
-                break
-        except:
-            pass
-        
-        print()
+    wait_start = time.monotonic()
+    state = wait_for_chrome_ready(process1, user_data_dir, 8)
+    print(f"等待结果: {state} (耗时: {time.monotonic() - wait_start:.1f}秒)")
+    
+    current_processes = snapshot_chrome_mains()
+    print(f"找到{len(current_processes)}个Chrome主进程")
+    
+    lines = []
+    for proc in current_processes:
+        profile = proc['profile_dir'] or "Default"
+        is_new = proc['pid'] not in initial_pids
+        marker = " [新]" if is_new else ""
+        lines.append(f"   PID: {proc['pid']}, Profile: {profile}{marker}")
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+    
+    # 检查启动进程状态
+    if state == 'exited':
+        stderr_file1.seek(0)
+        stderr = stderr_file1.read()
+        print(f"启动进程已退出，返回码: {process1.returncode}")
+        if stderr:
+            print(f"stderr: {stderr.decode()}")
+    
+    print()
 
 except Exception as e:
     print(f"方法1启动失败: {e}")
@@ -111,6 +91,8 @@ except Exception as e:
 print("\n3. 方法2: 使用独立的用户数据目录...")
 
 temp_user_data_dir = "/tmp/chrome_profile2_test"
+# 预先创建目录，等待启动时可以直接监听其中SingletonLock的出现
+os.makedirs(temp_user_data_dir, exist_ok=True)
 cmd2 = [
     chrome_executable,
     f"--user-data-dir={temp_user_data_dir}",
@@ -124,63 +106,68 @@ cmd2 = [
 print(f"启动命令: {' '.join(cmd2)}")
 
 try:
+    # 同方法1：stdout丢弃，stderr写入临时文件
+    stderr_file2 = tempfile.TemporaryFile()
     process2 = subprocess.Popen(cmd2, 
-                               stdout=subprocess.PIPE, 
-                               stderr=subprocess.PIPE,
+                               stdout=subprocess.DEVNULL, 
+                               stderr=stderr_file2,
                                start_new_session=True)
     
     print(f"启动进程PID: {process2.pid}")
     
-    # 等待Chrome启动
+    # 等待Chrome启动：SingletonLock指向新进程或启动进程退出时立即返回，最多5秒
     print("等待Chrome启动...")
-    for i in range(5):
-        time.sleep(1)
-        current_processes = get_chrome_processes()
-        
-        print(f"第{i+1}次检查: 找到{len(current_processes)}个Chrome主进程")
-        
-        for proc in current_processes:
-            cmdline_list = proc['cmdline'].split()
-            profile = extract_profile_from_cmdline(cmdline_list)
-            user_data = "temp" if temp_user_data_dir in proc['cmdline'] else "normal"
-            is_new = proc['pid'] not in [p['pid'] for p in initial_processes]
-            marker = " [新]" if is_new else ""
-            print(f"   PID: {proc['pid']}, Profile: {profile}, 数据目录: {user_data}{marker}")
-        
-        # 检查启动进程状态
-        try:
-            poll_result = process2.poll()
-            if poll_result is not None:
-                stdout, stderr = process2.communicate()
-                print(f"启动进程已退出，返回码: {poll_result}")
-                if stdout:
-                    print(f"stdout: {stdout.decode()}")
-                if stderr:
-                    print(f"stderr: {stderr.decode()}")
-                break
-        except:
-            pass
-        
-        print()
+    wait_start = time.monotonic()
+    state = wait_for_chrome_ready(process2, temp_user_data_dir, 5)
+    print(f"等待结果: {state} (耗时: {time.monotonic() - wait_start:.1f}秒)")
+    
+    current_processes = snapshot_chrome_mains()
+    print(f"找到{len(current_processes)}个Chrome主进程")
+    
+    lines = []
+    for proc in current_processes:
+        profile = proc['profile_dir'] or "Default"
+        user_data = "temp" if proc['user_data_dir'] == temp_user_data_dir else "normal"
+        is_new = proc['pid'] not in initial_pids
+        marker = " [新]" if is_new else ""
+        lines.append(f"   PID: {proc['pid']}, Profile: {profile}, 数据目录: {user_data}{marker}")
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+    
+    # 检查启动进程状态
+    if state == 'exited':
+        stderr_file2.seek(0)
+        stderr = stderr_file2.read()
+        print(f"启动进程已退出，返回码: {process2.returncode}")
+        if stderr:
+            print(f"stderr: {stderr.decode()}")
+    
+    print()
 
 except Exception as e:
     print(f"方法2启动失败: {e}")
 
 print("\n4. 最终状态:")
-final_processes = get_chrome_processes()
+final_processes = snapshot_chrome_mains()
+lines = []
 for proc in final_processes:
-    cmdline_list = proc['cmdline'].split()
-    profile = extract_profile_from_cmdline(cmdline_list)
-    user_data = "temp" if "/tmp/chrome_profile2_test" in proc['cmdline'] else "normal"
-    print(f"   PID: {proc['pid']}, Profile: {profile}, 数据目录: {user_data}")
+    profile = proc['profile_dir'] or "Default"
+    user_data = "temp" if proc['user_data_dir'] == temp_user_data_dir else "normal"
+    lines.append(f"   PID: {proc['pid']}, Profile: {profile}, 数据目录: {user_data}")
+if lines:
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 print(f"最终Chrome主进程数: {len(final_processes)}")
 
-# 清理临时目录
-import shutil
+# 清理临时目录：先原子改名让原路径立即可用，再交给后台rm删除大量缓存小文件，不阻塞脚本退出
 if os.path.exists(temp_user_data_dir):
+    trash_dir = f"{temp_user_data_dir}.trash.{os.getpid()}"
     try:
-        shutil.rmtree(temp_user_data_dir)
-        print(f"已清理临时目录: {temp_user_data_dir}")
-    except:
+        os.rename(temp_user_data_dir, trash_dir)
+        subprocess.Popen(['rm', '-rf', trash_dir],
+                         stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL,
+                         start_new_session=True)
+        print(f"已清理临时目录: {temp_user_data_dir}（后台删除中）")
+    except OSError:
         print(f"无法清理临时目录: {temp_user_data_dir}") 
\ No newline at end of file
@@ -7,6 +7,7 @@
 """
 
 import time
+from _chrome_procs import snapshot_chrome_mains
 from core.browser_manager import BrowserManager
 from core.profile_manager import ProfileManager
 
@@ -71,32 +72,13 @@ def test_gui_startup_flow():
         print("\n=== 详细诊断 ===")
         print("检查当前的Chrome进程...")
         
-        import psutil
-        chrome_processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-            try:
-                if proc.info['name'] == 'Google Chrome':
-                    cmdline = proc.info['cmdline']
-                    if cmdline and not any('--type=' in arg for arg in cmdline):
-                        chrome_processes.append({
-                            'pid': proc.info['pid'],
-                            'cmdline': ' '.join(cmdline)
-                        })
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                continue
+        chrome_processes = snapshot_chrome_mains()
         
         for i, proc in enumerate(chrome_processes, 1):
             print(f"Chrome进程 {i}:")
             print(f"  PID: {proc['pid']}")
-            # 提取用户数据目录
-            cmdline = proc['cmdline']
-            if '--user-data-dir=' in cmdline:
-                start = cmdline.find('--user-data-dir=') + len('--user-data-dir=')
-                end = cmdline.find(' ', start)
-                if end == -1:
-                    end = len(cmdline)
-                user_data_dir = cmdline[start:end]
-                print(f"  用户数据目录: {user_data_dir}")
+            if proc['user_data_dir']:
+                print(f"  用户数据目录: {proc['user_data_dir']}")
             print()
         
         return
@@ -113,20 +95,10 @@ def test_gui_startup_flow():
         
         # 显示最终状态
         print("\n=== 最终状态 ===")
-        running_instances = list(bm.running_instances.keys())
-        print(f"Browser Manager中的运行实例: {running_instances}")
+        print(f"Browser Manager中的运行实例: {', '.join(bm.running_instances)}")
         
         # 检查实际Chrome进程
-        import psutil
-        chrome_count = 0
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-            try:
-                if proc.info['name'] == 'Google Chrome':
-                    cmdline = proc.info['cmdline']
-                    if cmdline and not any('--type=' in arg for arg in cmdline):
-                        chrome_count += 1
-            except:
-                continue
+        chrome_count = len(snapshot_chrome_mains())
         
         print(f"实际Chrome主进程数: {chrome_count}")
         
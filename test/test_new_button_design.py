@@ -29,56 +29,61 @@ def test_new_button_design():
     
     print("\n1. 测试启动功能...")
     
-    # 检查初始状态
-    is_running_before = bm.is_browser_running(profile.name)
-    print(f"启动前状态: {'运行中' if is_running_before else '未运行'}")
+    # 检查初始状态；已在运行时先关闭，最多尝试max_retries次
+    # （复用已创建的管理器和Profile列表，不再递归重跑整个测试）
+    max_retries = 3
+    for attempt in range(max_retries + 1):
+        is_running_before = bm.is_browser_running(profile.name)
+        print(f"启动前状态: {'运行中' if is_running_before else '未运行'}")
+        if not is_running_before:
+            break
+        if attempt == max_retries:
+            print(f"❌ {max_retries}次关闭后Profile仍在运行，测试中止")
+            return
+        print(f"Profile已在运行中，先关闭再测试（第{attempt + 1}次）")
+        bm.close_browser(profile.name)
+        time.sleep(2)
+    
+    # 测试启动
+    print("执行启动操作...")
+    success = bm.start_browser(profile, language='zh-CN', window_size=(1280, 720))
     
-    if not is_running_before:
-        # 测试启动
-        print("执行启动操作...")
-        success = bm.start_browser(profile, language='zh-CN', window_size=(1280, 720))
+    if success:
+        print("✅ 启动成功")
+        time.sleep(2)  # 等待浏览器启动
         
-        if success:
-            print("✅ 启动成功")
-            time.sleep(2)  # 等待浏览器启动
+        # 验证状态
+        is_running_after = bm.is_browser_running(profile.name)
+        print(f"启动后状态: {'运行中' if is_running_after else '未运行'}")
+        
+        if is_running_after:
+            print("\n2. 测试关闭功能...")
             
-            # 验证状态
-            is_running_after = bm.is_browser_running(profile.name)
-            print(f"启动后状态: {'运行中' if is_running_after else '未运行'}")
+            # 测试关闭
+            print("执行关闭操作...")
+            close_success = bm.close_browser(profile.name)
             
-            if is_running_after:
-                print("\n2. 测试关闭功能...")
+            if close_success:
+                print("✅ 关闭成功")
+                time.sleep(1)  # 等待关闭完成
                 
-                # 测试关闭
-                print("执行关闭操作...")
-                close_success = bm.close_browser(profile.name)
+                # 验证状态
+                is_running_final = bm.is_browser_running(profile.name)
+                print(f"关闭后状态: {'运行中' if is_running_final else '未运行'}")
                 
-                if close_success:
-                    print("✅ 关闭成功")
-                    time.sleep(1)  # 等待关闭完成
-                    
-                    # 验证状态
-                    is_running_final = bm.is_browser_running(profile.name)
-                    print(f"关闭后状态: {'运行中' if is_running_final else '未运行'}")
-                    
-                    if not is_running_final:
-                        print("\n🎉 切换按钮功能测试成功！")
-                        print("- 启动功能: ✅")
-                        print("- 关闭功能: ✅")
-                        print("- 状态检测: ✅")
-                    else:
-                        print("\n❌ 关闭功能测试失败")
+                if not is_running_final:
+                    print("\n🎉 切换按钮功能测试成功！")
+                    print("- 启动功能: ✅")
+                    print("- 关闭功能: ✅")
+                    print("- 状态检测: ✅")
                 else:
-                    print("❌ 关闭操作失败")
+                    print("\n❌ 关闭功能测试失败")
             else:
-                print("❌ 启动状态验证失败")
+                print("❌ 关闭操作失败")
         else:
-            print("❌ 启动操作失败")
+            print("❌ 启动状态验证失败")
     else:
-        print("Profile已在运行中，先关闭再测试")
-        bm.close_browser(profile.name)
-        time.sleep(2)
-        test_new_button_design()  # 递归重试
+        print("❌ 启动操作失败")
 
 if __name__ == "__main__":
     test_new_button_design() 
\ No newline at end of file
@@ -7,6 +7,7 @@
 
 from core.browser_manager import BrowserManager
 from core.profile_manager import ProfileManager
+from _chrome_procs import snapshot_chrome_mains
 import time
 
 def test_multi_instance_launch():
@@ -32,7 +33,7 @@ def test_multi_instance_launch():
     print(f'第一个Profile启动结果: {"成功" if success1 else "失败"}')
     
     if success1:
-        print(f'当前运行的实例: {list(bm.running_instances.keys())}')
+        print(f'当前运行的实例: {", ".join(bm.running_instances)}')
         
         # 等待一点时间
         print('\n等待5秒后启动第二个Profile...')
@@ -43,36 +44,17 @@ def test_multi_instance_launch():
         success2 = bm.start_browser(profiles[1], language='zh-CN', window_size=(1280, 720))
         print(f'第二个Profile启动结果: {"成功" if success2 else "失败"}')
         
-        print(f'\n最终运行的实例: {list(bm.running_instances.keys())}')
+        print(f'\n最终运行的实例: {", ".join(bm.running_instances)}')
         
         # 检查实际的Chrome进程
         print('\n=== 检查实际Chrome进程 ===')
-        import psutil
-        chrome_processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-            try:
-                if proc.info['name'] == 'Google Chrome':
-                    cmdline = proc.info['cmdline']
-                    if cmdline and not any('--type=' in arg for arg in cmdline):
-                        chrome_processes.append({
-                            'pid': proc.info['pid'],
-                            'cmdline': ' '.join(cmdline)
-                        })
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                continue
+        chrome_processes = snapshot_chrome_mains()
         
         # print(f'发现 {len(chrome_processes)} 个Chrome主进程:')
         for i, proc in enumerate(chrome_processes, 1):
             print(f'  {i}. PID: {proc["pid"]}')
-            # 提取用户数据目录
-            cmdline = proc['cmdline']
-            if '--user-data-dir=' in cmdline:
-                start = cmdline.find('--user-data-dir=') + len('--user-data-dir=')
-                end = cmdline.find(' ', start)
-                if end == -1:
-                    end = len(cmdline)
-                user_data_dir = cmdline[start:end]
-                print(f'     用户数据目录: {user_data_dir}')
+            if proc['user_data_dir']:
+                print(f'     用户数据目录: {proc["user_data_dir"]}')
         
         if len(chrome_processes) >= 2:
             print('\n✅ 成功启动了多个独立的Chrome实例！')
@@ -5,13 +5,16 @@
 测试Profile名称解析逻辑
 """
 
-import re
+import shlex
+from _chrome_args import parse_chrome_flags
+
+USER_DATA = '/Users/zmj/Library/Application Support/Google/Chrome'
 
 def test_profile_parsing():
     # 模拟真实的命令行参数
     cmdline = [
         '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
-        '--user-data-dir=/Users/zmj/Library/Application Support/Google/Chrome',
+        f'--user-data-dir={USER_DATA}',
         '--profile-directory=Profile 1',
         '--lang=zh-CN',
         '--window-size=1280,720',
@@ -20,67 +23,49 @@ def test_profile_parsing():
         '--new-window'
     ]
     
-    cmdline_str = ' '.join(cmdline)
-    
     print("=== 测试Profile名称解析 ===")
-    print(f"命令行字符串: {cmdline_str}")
+    print(f"命令行参数: {cmdline}")
     print()
     
-    # 测试当前的正则表达式
-    print("1. 测试正则表达式方法:")
-    
-    # 先尝试匹配带引号的情况: --profile-directory="Profile 1"
-    profile_match = re.search(r'--profile-directory[=\s]+"([^"]+)"', cmdline_str)
-    if profile_match:
-        profile_name = profile_match.group(1)
-        print(f"   带引号匹配成功: {profile_name}")
-    else:
-        print("   带引号匹配失败")
-        
-        # 再尝试匹配不带引号但用等号的情况: --profile-directory=Profile 1
-        profile_match = re.search(r'--profile-directory=([^\s]+(?:\\\s[^\s]*)*)', cmdline_str)
-        if profile_match:
-            profile_name = profile_match.group(1)
-            profile_name = profile_name.replace('\\ ', ' ')
-            print(f"   等号+转义匹配成功: {profile_name}")
-        else:
-            print("   等号+转义匹配失败")
-            
-            # 最后尝试更简单的方法：匹配到空格前
-            profile_match = re.search(r'--profile-directory=([^\s]+)', cmdline_str)
-            if profile_match:
-                profile_name = profile_match.group(1)
-                print(f"   简单等号匹配成功: {profile_name} (这就是问题所在!)")
-            else:
-                print("   简单等号匹配失败")
+    # 直接在参数列表上解析，Profile名称中的空格不会丢失
+    print("1. 测试命令行数组方法（等号连接）:")
+    flags = parse_chrome_flags(cmdline)
+    assert flags['--profile-directory'] == 'Profile 1', flags
+    assert flags['--user-data-dir'] == USER_DATA, flags
+    print(f"   匹配成功: {flags['--profile-directory']}")
     
     print()
-    print("2. 测试命令行数组方法:")
+    print("2. 测试命令行数组方法（分离参数）:")
+    separated = [cmdline[0], '--user-data-dir', USER_DATA, '--profile-directory', 'Profile 1']
+    flags = parse_chrome_flags(separated)
+    assert flags['--profile-directory'] == 'Profile 1', flags
+    assert flags['--user-data-dir'] == USER_DATA, flags
+    print(f"   匹配成功: {flags['--profile-directory']}")
     
-    profile_name = None
-    for i, arg in enumerate(cmdline):
-        if arg == '--profile-directory' and i + 1 < len(cmdline):
-            profile_name = cmdline[i + 1]
-            print(f"   分离参数匹配成功: {profile_name}")
-            break
-        elif arg.startswith('--profile-directory='):
-            profile_name = arg.split('=', 1)[1]
-            print(f"   等号连接匹配成功: {profile_name}")
-            break
+    print()
+    print("3. 测试命令行字符串（如日志中的命令）:")
+    # 字符串只需用shlex拆分一次，再交给同一个解析函数
+    cmdline_str = ' '.join(shlex.quote(arg) for arg in cmdline)
+    print(f"   命令行字符串: {cmdline_str}")
+    flags = parse_chrome_flags(shlex.split(cmdline_str))
+    assert flags['--profile-directory'] == 'Profile 1', flags
+    print(f"   匹配成功: {flags['--profile-directory']}")
     
-    if not profile_name:
-        print("   命令行数组方法匹配失败")
+    print()
+    print("4. 测试未指定Profile的情况:")
+    flags = parse_chrome_flags(cmdline[:2])
+    assert '--profile-directory' not in flags, flags
+    print("   未找到--profile-directory，使用Default")
     
     print()
-    print("3. 正确的正则表达式应该是:")
+    print("5. 测试分离参数缺少值的情况:")
+    missing_value = [cmdline[0], '--user-data-dir', '--profile-directory=Profile 1']
+    flags = parse_chrome_flags(missing_value)
+    assert flags == {'--profile-directory': 'Profile 1'}, flags
+    print(f"   匹配成功: {flags['--profile-directory']}")
     
-    # 正确的正则表达式，处理等号后面有空格的情况
-    profile_match = re.search(r'--profile-directory=(.+?)(?:\s--|\s-[^-]|$)', cmdline_str)
-    if profile_match:
-        profile_name = profile_match.group(1).strip()
-        print(f"   改进正则匹配成功: {profile_name}")
-    else:
-        print("   改进正则匹配失败")
+    print()
+    print("✅ 全部解析测试通过")
 
 if __name__ == "__main__":
-    test_profile_parsing() 
\ No newline at end of file
+    test_profile_parsing()
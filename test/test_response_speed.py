@@ -7,7 +7,7 @@
 """
 
 import time
-import psutil
+from _chrome_procs import wait_for_exit
 from core.browser_manager import BrowserManager
 from core.profile_manager import ProfileManager
 
@@ -60,7 +60,8 @@ def test_response_speed():
     # 模拟用户外部关闭浏览器
     print("3. 模拟外部关闭浏览器...")
     try:
-        chrome_process = psutil.Process(chrome_pid)
+        # 直接复用BrowserManager已持有的Process对象
+        chrome_process = instance.process
         chrome_process.terminate()
         print(f"✅ 已向Chrome进程 {chrome_pid} 发送终止信号")
     except Exception as e:
@@ -69,25 +70,17 @@ def test_response_speed():
     
     # 等待进程真正结束
     print("4. 等待进程结束...")
-    wait_time = 0
     max_wait = 10  # 最多等待10秒
+    wait_start = time.monotonic()
     
-    while wait_time < max_wait:
-        try:
-            if not chrome_process.is_running():
-                print(f"✅ Chrome进程已结束 (等待时间: {wait_time:.1f}秒)")
-                break
-        except psutil.NoSuchProcess:
-            print(f"✅ Chrome进程已结束 (等待时间: {wait_time:.1f}秒)")
-            break
-        
-        time.sleep(0.1)
-        wait_time += 0.1
-    
-    if wait_time >= max_wait:
+    # 由内核通知进程退出，不再每100ms轮询
+    if not wait_for_exit(chrome_pid, max_wait):
         print("❌ Chrome进程未在预期时间内结束")
         return
     
+    wait_time = time.monotonic() - wait_start
+    print(f"✅ Chrome进程已结束 (等待时间: {wait_time:.1f}秒)")
+    
     # 测试检测速度
     print("5. 测试检测速度...")
     detection_start = time.time()
@@ -106,8 +99,8 @@ def test_response_speed():
             detected = True
             break
         
-        # 或者检查is_browser_running状态
-        if not bm.is_browser_running(profile.name):
+        # 清理之后只需查字典即可：is_browser_running对未跟踪的Profile会再扫描一遍全部进程
+        if profile.name not in bm.running_instances:
             detection_time = time.time() - detection_start
             print(f"✅ 状态检查检测到关闭 (检测时间: {detection_time:.2f}秒)")
             detected = True
@@ -130,10 +123,11 @@ def test_response_speed():
     # 最终状态确认
     print("6. 最终状态确认...")
     final_status = bm.is_browser_running(profile.name)
-    running_instances = list(bm.running_instances.keys())
+    # 本阶段只取一次快照，后续打印和判断都复用
+    running_instances = tuple(bm.running_instances)
     
     print(f"最终运行状态: {'运行中' if final_status else '未运行'}")
-    print(f"运行实例列表: {running_instances}")
+    print(f"运行实例列表: {', '.join(running_instances)}")
     
     if not final_status and profile.name not in running_instances:
         print("✅ 状态正确：浏览器已完全清理")